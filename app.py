@@ -12,28 +12,153 @@ JIRA Degrade % 分析系統 - 修復版
 6. 趨勢圖加入 CCC issue 數量線
 """
 
-from flask import Flask, jsonify, render_template, request, send_file
+from flask import (Flask, Response, after_this_request, jsonify, render_template,
+                   request, send_file, stream_template, stream_with_context)
 from flask_cors import CORS
 from dotenv import load_dotenv
 import os
 from datetime import datetime, timedelta
-from collections import defaultdict
-from jira_degrade_manager import JiraDegradeManagerFast, load_all_filters_parallel
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from jira_degrade_manager import JiraDegradeManagerFast, fetch_filters_parallel
 import time
-import io
+import atexit
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
-from urllib.parse import quote
+import functools
+import gzip
+import hashlib
+import heapq
+import itertools
 import json
+import logging
+import pickle
+import queue
 import socket
+import tempfile
+import threading
+import zlib
+from operator import itemgetter
+from logging.handlers import QueueHandler, QueueListener
+
+# orjson 序列化比 stdlib json 快 2~5 倍，沒安裝時退回 stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 載入環境變數
 load_dotenv()
 
+# logging 取代散落的 print：實際的 stdout 寫入移到背景 listener 執行緒，
+# 請求執行緒只做一次 queue.put，多 worker 下不會搶 stdout 鎖
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+
+# gunicorn --preload 在 master import 完後才 fork worker，
+# listener 的消費執行緒不會跟著進入子行程；fork 後在子行程重啟 listener，
+# 否則 worker 的 log 會堆在 queue 裡永遠不輸出
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_log_listener.start)
+
+# format 只留 %(message)s：QueueHandler 端不先烙上 LEVEL:name: 前綴，
+# 時間戳/等級統一由 listener 端的 StreamHandler formatter 補
+logging.basicConfig(
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
+)
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 CORS(app)
 
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """讓所有 jsonify（含錯誤回應與小型端點）都走 orjson 序列化"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+def ojsonify(obj):
+    """大型 payload 用 orjson 直接輸出 bytes（省掉中間 str）；沒有 orjson 時退回 jsonify"""
+    if orjson is not None:
+        return app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json'
+        )
+    return jsonify(obj)
+
+def _dumps(obj):
+    """匯出模板內嵌 JSON 用：orjson 可用時序列化快 3-10 倍，否則退回內建 json"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def _gzip_stream(chunks, level=1):
+    """把字串/bytes chunk 產生器包成 gzip 串流（level 1：CPU 便宜，報告仍可壓到約 1/10）"""
+    comp = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = comp.compress(chunk)
+        if data:
+            yield data
+    yield comp.flush()
+
+@app.after_request
+def _compress_json_response(response):
+    """
+    大型 JSON 回應以 gzip 壓縮後再送出：
+    統計資料（weekly/assignees 等鍵名）重複性很高，通常可壓到 1/5 ~ 1/10。
+    HTML 匯出是串流、各自處理壓縮，這裡只處理一般 JSON 端點
+    """
+    if (response.status_code != 200
+            or response.mimetype != 'application/json'
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+
+    payload = response.get_data()
+    if len(payload) < 1024:  # 小回應壓了反而虧（標頭 + CPU）
+        return response
+
+    response.set_data(gzip.compress(payload, compresslevel=5))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+# 已完成報告的 gzip bytes 快取：同一份資料、相同匯出條件的重複匯出直接回用
+# （鍵含快取時間戳，資料重載後舊報告自然失效；FIFO 淘汰控制記憶體）
+_REPORT_CACHE = {}
+_REPORT_CACHE_LOCK = threading.Lock()
+_REPORT_CACHE_MAX = 16
+
+def _collect_report(stream, key):
+    """邊串流邊收集 gzip bytes，整份產完後放進報告快取"""
+    chunks = []
+    for chunk in stream:
+        chunks.append(chunk)
+        yield chunk
+    with _REPORT_CACHE_LOCK:
+        if len(_REPORT_CACHE) >= _REPORT_CACHE_MAX:
+            _REPORT_CACHE.pop(next(iter(_REPORT_CACHE)))
+        _REPORT_CACHE[key] = b''.join(chunks)
+
 # JIRA 連線設定
 JIRA_CONFIG = {
     'internal': {
@@ -74,6 +199,14 @@ MTTR_FILTERS = {
     }
 }
 
+# 匯出模板要內嵌的常數 JSON：每個行程只序列化一次
+JIRA_SITES = {
+    'internal': JIRA_CONFIG['internal']['site'],
+    'vendor': JIRA_CONFIG['vendor']['site']
+}
+JIRA_SITES_JSON = _dumps(JIRA_SITES)
+FILTERS_JSON = _dumps(FILTERS)
+
 # 檢查是否啟用 MTTR 功能
 MTTR_ENABLED = any([
     MTTR_FILTERS['resolved']['internal'],
@@ -83,111 +216,327 @@ MTTR_ENABLED = any([
 ])
 
 class DataCache:
-    """記憶體快取"""
-    def __init__(self, ttl_seconds=3600):
+    """記憶體快取（支援 stale-while-revalidate：過期先回舊資料，背景重新載入）"""
+    def __init__(self, ttl_seconds=3600, persist_path=None):
         self.data = None
         self.timestamp = None
+        # data/timestamp 必須成對更新與讀取，否則 clear() 進行到一半時
+        # 讀取端可能拿到 (舊 data, None) 這種撕裂的組合
+        self._lock = threading.Lock()
         self.ttl = ttl_seconds
-    
+        # 超過 hard_ttl 的資料視為太舊，不再以 stale 回應（此時才阻塞重載）
+        self.hard_ttl = ttl_seconds * 4
+        # 選擇性落地到磁碟：重啟後直接還原快取，不必冷啟動重抓 JIRA
+        self.persist_path = persist_path
+        if persist_path:
+            self._load_from_disk()
+
     def set(self, data):
-        self.data = data
-        self.timestamp = time.time()
-    
+        with self._lock:
+            self.data = data
+            self.timestamp = time.time()
+        if self.persist_path:
+            self._save_to_disk()
+
+    def _save_to_disk(self):
+        """把快取內容寫到磁碟（先寫暫存檔再 rename，避免寫到一半被讀到）"""
+        try:
+            tmp_path = self.persist_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'data': self.data, 'ts': self.timestamp}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.persist_path)
+        except Exception as e:
+            logger.warning(f"⚠️  快取寫入磁碟失敗（不影響服務）: {e}")
+
+    def _load_from_disk(self):
+        """啟動時從磁碟還原快取；只接受仍在 TTL 內的資料"""
+        try:
+            if not os.path.exists(self.persist_path):
+                return
+            with open(self.persist_path, 'rb') as f:
+                saved = pickle.load(f)
+            if time.time() - saved['ts'] <= self.ttl:
+                self.data = saved['data']
+                self.timestamp = saved['ts']
+                logger.info(f"💾 從磁碟還原快取 (年齡: {time.time() - saved['ts']:.0f}秒)")
+        except Exception as e:
+            logger.warning(f"⚠️  快取從磁碟還原失敗（將重新載入）: {e}")
+
+    def snapshot(self):
+        """原子地回傳 (data, timestamp)：拿到的一定是同一次 set() 的配對"""
+        with self._lock:
+            return self.data, self.timestamp
+
     def get(self):
-        if self.data is None or self.timestamp is None:
+        data, ts = self.snapshot()
+        if data is None or ts is None:
             return None
-        
-        if time.time() - self.timestamp > self.ttl:
+
+        if time.time() - ts > self.ttl:
             return None
-        
-        return self.data
-    
+
+        return data
+
+    def get_stale(self):
+        """TTL 過期後仍回傳舊資料（SWR）；超過 hard_ttl 視為太舊，回傳 None"""
+        data, ts = self.snapshot()
+        if data is None or ts is None:
+            return None
+
+        if time.time() - ts > self.hard_ttl:
+            return None
+
+        return data
+
     def age(self):
         """回傳快取年齡（秒）"""
         if self.timestamp is None:
             return None
         return time.time() - self.timestamp
-    
+
     def clear(self):
-        self.data = None
-        self.timestamp = None
+        with self._lock:
+            self.data = None
+            self.timestamp = None
+        if self.persist_path:
+            try:
+                os.remove(self.persist_path)
+            except OSError:
+                pass
+
+# 建立全域快取 - 從 .env 讀取 TTL（預設 1 小時），落地到磁碟讓重啟不必冷載入
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_TTL = int(os.getenv('CACHE_TTL', 3600))
+cache = DataCache(ttl_seconds=CACHE_TTL, persist_path=os.path.join(BASE_DIR, '.cache.pkl'))
+
+# _compute_stats 的資料來源註冊表：以快取 timestamp 為鍵保留最近兩份快照，
+# 讓已取得舊快照的請求在 cache.clear()（/api/refresh 重載期間）之後
+# 仍能完成統計，而不是從全域快取讀到 None
+_STATS_SNAPSHOTS = {}
+_stats_snapshot_lock = threading.Lock()
+
+def _register_stats_snapshot(ts, data):
+    with _stats_snapshot_lock:
+        _STATS_SNAPSHOTS[ts] = data
+        while len(_STATS_SNAPSHOTS) > 2:
+            _STATS_SNAPSHOTS.pop(next(iter(_STATS_SNAPSHOTS)))
+
+# 磁碟還原的快取也要標記 timestamp 並註冊快照，
+# _compute_stats 才能以 timestamp 取回對應的資料
+if cache.data is not None:
+    cache.data['_cache_ts'] = cache.timestamp
+    _register_stats_snapshot(cache.timestamp, cache.data)
+
+# 每個 filter 一份獨立快取（TTL 各自計時）：
+# 快取過期時只重新抓取過期的那幾個 filter，其餘沿用快取，再於查詢時合併
+FILTER_CACHES = {
+    name: DataCache(ttl_seconds=CACHE_TTL)
+    for name in ('internal_degrade', 'vendor_degrade', 'internal_resolved', 'vendor_resolved')
+}
+
+# 統計運算共用的執行緒池（週次統計與 assignee 分布互相獨立，可平行計算）
+STATS_EXECUTOR = ThreadPoolExecutor(max_workers=6, thread_name_prefix='stats')
+
+# JIRA 抓取共用的 I/O 執行緒池：行程啟動建一次，
+# 不必每次 MTTR 快取過期都重新開關 4 條執行緒
+IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv('IO_WORKERS', 8)), thread_name_prefix='jira-io')
+
+@atexit.register
+def _shutdown_executors():
+    """行程結束時把執行緒池收乾淨（不等未完成的背景工作）"""
+    for pool in (STATS_EXECUTOR, IO_EXECUTOR):
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def _assignee_display_name(fields):
+    """從 fields 取 assignee 顯示名稱（處理 assignee 為 None 的情況）"""
+    assignee = fields.get('assignee')
+    if isinstance(assignee, dict):
+        return assignee.get('displayName', 'Unassigned')
+    return 'Unassigned'
+
+def _precompute_issue(issue):
+    """
+    為單一 issue 附加預先計算的欄位，讓過濾/統計熱迴圈不必重複解析：
+    - _created_ord: created 日期的整數 ordinal（日期過濾只需整數比較）
+    - _iso_week_key: created 所屬的 ISO 週次（如 2025-W32，週次統計直接查表）
+    - _assignee_name: assignee 顯示名稱（避免每次都走兩層 dict）
+    """
+    fields = issue.get('fields', {})
+
+    created = fields.get('created')
+    if created:
+        try:
+            created_dt = parse_issue_date(created)
+            issue['_created_ord'] = created_dt.toordinal()
+            iso = created_dt.isocalendar()
+            issue['_iso_week_key'] = f"{iso[0]}-W{iso[1]:02d}"
+        except Exception:
+            issue['_created_ord'] = None
+            issue['_iso_week_key'] = None
+    else:
+        issue['_created_ord'] = None
+        issue['_iso_week_key'] = None
 
-# 建立全域快取 - 從 .env 讀取 TTL（預設 1 小時）
-cache = DataCache(ttl_seconds=int(os.getenv('CACHE_TTL', 3600)))
+    issue['_assignee_name'] = _assignee_display_name(fields)
+
+def _normalize_filter_issues(name, issues):
+    """
+    單一 filter 的載入時正規化：附加預計算欄位 + _source 標記。
+    filter 名稱的前綴（internal_/vendor_）就是來源，不必再看 self URL
+    """
+    source = name.split('_', 1)[0]
+    for issue in issues:
+        _precompute_issue(issue)
+        issue['_source'] = source
+    return issues
 
 def load_data():
-    """載入資料並快取"""
+    """載入資料並快取（只重新抓取 TTL 過期的 filters，其餘沿用各自的快取）"""
     try:
-        print("📥 開始載入資料...")
-        raw_data = load_all_filters_parallel(JIRA_CONFIG, FILTERS)
-        
-        # 驗證資料格式
-        if not isinstance(raw_data, dict):
-            print(f"❌ 錯誤: raw_data 不是字典，類型為 {type(raw_data)}")
-            return None
-        
-        if 'degrade' not in raw_data or 'resolved' not in raw_data:
-            print(f"❌ 錯誤: raw_data 缺少必要的鍵")
-            print(f"   raw_data 的鍵: {list(raw_data.keys())}")
-            return None
-        
-        # 檢查是否為新格式（包含 issues 子鍵）
-        if isinstance(raw_data['degrade'], dict) and 'issues' in raw_data['degrade']:
-            print("📦 檢測到新格式資料（包含統計資訊）")
-            # 新格式：{'degrade': {'issues': [...], 'total': ..., 'weekly': ..., 'assignees': ...}}
-            data = {
-                'degrade': raw_data['degrade']['issues'],
-                'resolved': raw_data['resolved']['issues'],
-                'metadata': raw_data.get('metadata', {})
-            }
-            print(f"✅ 資料載入成功: degrade={len(data['degrade'])}, resolved={len(data['resolved'])}")
-        elif isinstance(raw_data['degrade'], list):
-            print("📦 檢測到舊格式資料（純列表）")
-            # 舊格式：{'degrade': [...], 'resolved': [...]}
-            data = raw_data
-            print(f"✅ 資料載入成功: degrade={len(data['degrade'])}, resolved={len(data['resolved'])}")
+        start_time = time.time()
+        expired = [name for name, fc in FILTER_CACHES.items() if fc.get() is None]
+
+        if expired:
+            logger.info(f"📥 開始載入資料（重新抓取 {len(expired)}/{len(FILTER_CACHES)} 個 filters）...")
+            fetched, warnings = fetch_filters_parallel(JIRA_CONFIG, FILTERS, expired)
+            # 正規化在進快取前做完：只有重新抓取的 filter 需要做，
+            # 各 filter 互相獨立、丟到執行緒池平行處理
+            list(STATS_EXECUTOR.map(
+                lambda name: _normalize_filter_issues(name, fetched.get(name, [])),
+                expired))
+            for name in expired:
+                FILTER_CACHES[name].set({
+                    'issues': fetched.get(name, []),
+                    'warnings': [w for w in warnings
+                                 if f"{w.get('source')}_{w.get('type')}" == name]
+                })
         else:
-            print(f"❌ 錯誤: data['degrade'] 格式不正確，類型為 {type(raw_data['degrade'])}")
-            if isinstance(raw_data['degrade'], dict):
-                print(f"   degrade 的鍵: {list(raw_data['degrade'].keys())}")
-            return None
-        
-        # 驗證最終格式
-        if not isinstance(data['degrade'], list):
-            print(f"❌ 錯誤: 處理後 data['degrade'] 仍不是列表")
-            return None
-        
-        if not isinstance(data['resolved'], list):
-            print(f"❌ 錯誤: 處理後 data['resolved'] 仍不是列表")
-            return None
-        
-        data['jira_sites'] = {
-            'internal': JIRA_CONFIG['internal']['site'],
-            'vendor': JIRA_CONFIG['vendor']['site']
+            logger.info("📥 所有 filter 快取皆有效，直接重新組裝資料")
+
+        # 合併四個 filter 快取（過期但仍在 hard_ttl 內的舊資料也可用）
+        parts = {
+            name: fc.get() or fc.get_stale() or {'issues': [], 'warnings': []}
+            for name, fc in FILTER_CACHES.items()
+        }
+
+        data = {
+            'degrade': parts['internal_degrade']['issues'] + parts['vendor_degrade']['issues'],
+            'resolved': parts['internal_resolved']['issues'] + parts['vendor_resolved']['issues'],
+            'metadata': {
+                'load_time': time.time() - start_time,
+                'timestamp': datetime.now().isoformat(),
+                'warnings': [w for p in parts.values() for w in p['warnings']]
+            }
+        }
+        logger.info(f"✅ 資料載入成功: degrade={len(data['degrade'])}, resolved={len(data['resolved'])}")
+
+        # 熱路徑欄位已在各 filter 進快取時正規化過；這裡只收集所有 assignees，
+        # 並替還原自舊版 pickle 快取、沒正規化過的 issue 補做一次
+        all_owners = set()
+        for issue in itertools.chain(data['degrade'], data['resolved']):
+            if '_created_ord' not in issue:
+                _precompute_issue(issue)
+            if issue.get('_source') not in ('internal', 'vendor'):
+                issue['_source'] = 'vendor' if 'vendorjira' in issue.get('self', '').lower() else 'internal'
+            all_owners.add(issue['_assignee_name'])
+        data['_all_owners'] = sorted(all_owners)
+
+        # SoA 欄位結構：把熱路徑需要的欄位抽成 (ordinal, assignee, issue) tuple 列表，
+        # 過濾時走訪緊湊的 tuple 而不是每個 issue 查兩層 dict
+        data['_columns'] = {
+            'degrade': [(i['_created_ord'], i['_assignee_name'], i) for i in data['degrade']],
+            'resolved': [(i['_created_ord'], i['_assignee_name'], i) for i in data['resolved']]
         }
+
+        data['jira_sites'] = JIRA_SITES
         cache.set(data)
+
+        # timestamp 跟著資料走：請求端用自己抓到的那份資料的 timestamp 查統計，
+        # 不受途中發生的 cache.clear() / 重載影響
+        data['_cache_ts'] = cache.timestamp
+        _register_stats_snapshot(data['_cache_ts'], data)
+
+        # 預熱無過濾條件的統計（儀表板初次載入的最常見查詢），
+        # 把 O(N) 的聚合成本算在載入這一次，之後的請求直接命中 memo
+        try:
+            _compute_stats(data['_cache_ts'], None, None, None)
+            logger.info("🔥 無過濾統計已預熱")
+        except Exception as e:
+            logger.warning(f"⚠️  統計預熱失敗（不影響服務）: {e}")
+
         return data
     except Exception as e:
-        print(f"❌ 載入資料失敗: {e}")
+        logger.error(f"❌ 載入資料失敗: {e}")
         import traceback
         traceback.print_exc()
         return None
 
+# 重新載入專用的單一 worker 執行緒池：
+# Future 就是載入狀態的把手，天生保證同一時間最多一個重載在跑
+REFRESH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='refresh')
+_refresh_future = None
+_refresh_lock = threading.Lock()
+
+# /api/refresh 的最小間隔（秒）：避免連點或前端迴圈打爆上游 JIRA API
+MIN_REFRESH_INTERVAL = int(os.getenv('MIN_REFRESH_INTERVAL', 60))
+_last_forced_refresh = 0.0
+
+def _submit_refresh(job=load_data):
+    """
+    提交一次資料重載，回傳 (future, started)
+    已有重載進行中時直接回傳進行中的 Future（started=False），不重複排隊
+    """
+    global _refresh_future
+    with _refresh_lock:
+        if _refresh_future is not None and not _refresh_future.done():
+            return _refresh_future, False
+        _refresh_future = REFRESH_POOL.submit(job)
+        return _refresh_future, True
+
+def _force_reload():
+    """清空所有快取後完整重載（/api/refresh 用）"""
+    cache.clear()
+    for fc in FILTER_CACHES.values():
+        fc.clear()
+    return load_data()
+
+def is_refreshing():
+    """是否有重載正在進行（供 /api/cache-status 回報）"""
+    return _refresh_future is not None and not _refresh_future.done()
+
+def _refresh_cache_async():
+    """在背景重新載入資料（SWR 用，不等待結果）"""
+    _submit_refresh()
+
 def get_data():
-    """取得資料（優先使用快取）"""
+    """取得資料（優先使用快取；TTL 過期先回舊資料並於背景更新）"""
     data = cache.get()
     if data:
         age = cache.age()
-        print(f"✓ 使用快取 (年齡: {age:.0f}秒)")
+        logger.debug(f"✓ 使用快取 (年齡: {age:.0f}秒)")
         return data
-    
-    print("⚠ 快取無效，重新載入...")
-    return load_data()
 
+    # stale-while-revalidate：過期但未超過 hard_ttl 的資料先回給前端，不阻塞請求
+    stale = cache.get_stale()
+    if stale is not None:
+        logger.warning("⚠ 快取過期，先回傳舊資料並於背景重新載入...")
+        _refresh_cache_async()
+        return stale
+
+    # 冷啟動 dogpile 防護：多個請求同時 miss 時只有一個真正去載入 JIRA，
+    # 其餘請求等同一個 Future 的結果
+    logger.warning("⚠ 快取無效，重新載入...")
+    future, _ = _submit_refresh()
+    return future.result()
+
+@functools.lru_cache(maxsize=512)
 def get_iso_week_dates(year, week):
     """
     根據 ISO 8601 標準計算指定年份和週次的起始和結束日期
     修正：結束日期使用 23:59:59，確保包含當天所有時間
+    （幾年的資料也只有數百組 (year, week)，memoize 後每組只算一次）
     """
     # 找到該年的第一天
     jan_4 = datetime(year, 1, 4)  # ISO 規則：包含 1 月 4 日的週就是第一週
@@ -200,81 +549,57 @@ def get_iso_week_dates(year, week):
     
     return target_monday, target_sunday
 
-def analyze_by_week_with_dates(issues, date_field='created'):
+def calculate_weekly_percentage(degrade_weekly, resolved_weekly):
     """
-    統計週次分布，並返回每週的起始和結束日期（符合 ISO 8601 標準）
-    修正：準確計算週次邊界，包含整天的 issues
-    
-    Args:
-        issues: issue 列表
-        date_field: 要使用的日期欄位（'created' 或 'created'）
+    計算每週百分比，並加入 degrade 和 resolved 的實際數量
+    兩個輸入的鍵都已排序（_aggregate_issues 保證），
+    這裡用 two-pointer 線性合併，省掉每次請求的 set 去重 + 重新排序
     """
-    weekly_stats = {}
-    
-    for issue in issues:
-        fields = issue.get('fields', {})
-        date_str = fields.get(date_field)
-        
-        if not date_str:
-            continue
-        
-        try:
-            # 解析日期（可能包含時間）
-            if 'T' in date_str:
-                # 完整的 ISO 格式：2025-08-10T14:30:00.000+0800
-                issue_date = datetime.fromisoformat(date_str.replace('Z', '+00:00').split('.')[0])
-            else:
-                # 只有日期：2025-08-10
-                issue_date = datetime.strptime(date_str[:10], '%Y-%m-%d')
-            
-            # 計算 ISO 週次
-            iso_calendar = issue_date.isocalendar()
-            iso_year = iso_calendar[0]
-            iso_week = iso_calendar[1]
-            week_key = f"{iso_year}-W{iso_week:02d}"
-            
-            if week_key not in weekly_stats:
-                # 使用正確的 ISO 週次計算方法
-                week_start, week_end = get_iso_week_dates(iso_year, iso_week)
-                
-                weekly_stats[week_key] = {
-                    'count': 0,
-                    'issues': [],
-                    'start_date': week_start.strftime('%Y-%m-%d'),
-                    'end_date': week_end.strftime('%Y-%m-%d'),
-                    # 新增：用於 JIRA JQL 查詢的精確時間
-                    'start_datetime': week_start.strftime('%Y-%m-%d %H:%M'),
-                    'end_datetime': week_end.strftime('%Y-%m-%d %H:%M')
-                }
-            
-            weekly_stats[week_key]['count'] += 1
-            weekly_stats[week_key]['issues'].append(issue.get('key'))
-            
-        except Exception as e:
-            print(f"⚠️  週次統計錯誤: {e} (issue: {issue.get('key')}, date: {date_str})")
-            continue
-    
-    return weekly_stats
+    d_keys = list(degrade_weekly)
+    r_keys = list(resolved_weekly)
+    di, ri = 0, 0
 
-def calculate_weekly_percentage(degrade_weekly, resolved_weekly):
-    """計算每週百分比，並加入 degrade 和 resolved 的實際數量"""
-    all_weeks = sorted(set(list(degrade_weekly.keys()) + list(resolved_weekly.keys())))
-    
     weekly_stats = []
-    for week in all_weeks:
+    while di < len(d_keys) or ri < len(r_keys):
+        d_week = d_keys[di] if di < len(d_keys) else None
+        r_week = r_keys[ri] if ri < len(r_keys) else None
+
+        if r_week is None or (d_week is not None and d_week < r_week):
+            week = d_week
+            di += 1
+        elif d_week is None or r_week < d_week:
+            week = r_week
+            ri += 1
+        else:
+            week = d_week
+            di += 1
+            ri += 1
+
         degrade_count = degrade_weekly.get(week, {}).get('count', 0)
         resolved_count = resolved_weekly.get(week, {}).get('count', 0)
         percentage = (degrade_count / resolved_count * 100) if resolved_count > 0 else 0
-        
+
         weekly_stats.append({
             'week': week,
             'degrade_count': degrade_count,
             'resolved_count': resolved_count,
             'percentage': round(percentage, 2)
         })
-    
+
     return weekly_stats
 
+@functools.lru_cache(maxsize=8192)
+def parse_issue_date(date_str):
+    """
+    解析 issue 的日期字串（可能包含時間）
+    同一天的日期字串會在大量 issues 中重複出現，strptime 很慢，所以做 memoize
+    """
+    if 'T' in date_str:
+        # 完整的 ISO 格式：2025-08-10T14:30:00.000+0800
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00').split('.')[0])
+    # 只有日期：2025-08-10（fromisoformat 是 C 實作，比 strptime 快一個數量級）
+    return datetime.fromisoformat(date_str[:10])
+
 def filter_issues(issues, start_date, end_date, owner, date_field='created'):
     """
     過濾 issues
@@ -287,58 +612,61 @@ def filter_issues(issues, start_date, end_date, owner, date_field='created'):
         date_field: 要使用的日期欄位（'created' 或 'created'）
     """
     filtered = []
-    
+
     # 確保 issues 是列表
     if not isinstance(issues, list):
-        print(f"⚠️  警告: issues 不是列表，類型為 {type(issues)}")
+        logger.warning(f"⚠️  警告: issues 不是列表，類型為 {type(issues)}")
         return []
-    
+
+    # 完全沒有過濾條件（預設儀表板視圖）就不必走訪，直接回傳原列表
+    if not start_date and not end_date and not owner:
+        return issues
+
+    # 過濾邊界只解析一次，沒給的邊界用哨兵值補齊：
+    # 熱迴圈內只剩一個範圍比較，沒有 if start/if end 分支
+    start_ord = datetime.fromisoformat(start_date).toordinal() if start_date else 0
+    end_ord = datetime.fromisoformat(end_date).toordinal() if end_date else 10 ** 9
+    check_dates = bool(start_date or end_date)
+
     for issue in issues:
         # 確保 issue 是字典
         if not isinstance(issue, dict):
-            print(f"⚠️  警告: issue 不是字典，類型為 {type(issue)}")
+            logger.warning(f"⚠️  警告: issue 不是字典，類型為 {type(issue)}")
             continue
-            
-        fields = issue.get('fields', {})
-        
-        # 日期過濾 - 使用指定的日期欄位
-        if start_date or end_date:
-            date_value = fields.get(date_field)
-            if date_value:
-                try:
-                    # 解析日期（處理時間部分）
-                    if 'T' in date_value:
-                        issue_date = datetime.fromisoformat(date_value.replace('Z', '+00:00').split('.')[0])
-                    else:
-                        issue_date = datetime.strptime(date_value[:10], '%Y-%m-%d')
-                    
-                    if start_date:
-                        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-                        if issue_date < start_dt:
-                            continue
-                    
-                    if end_date:
-                        # 結束日期包含整天：23:59:59
-                        end_dt = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(hours=23, minutes=59, seconds=59)
-                        if issue_date > end_dt:
-                            continue
-                except Exception as e:
-                    print(f"⚠️  日期解析錯誤: {e} (issue: {issue.get('key')}, date: {date_value})")
-                    pass
-        
+
+        # 日期過濾 - 優先使用載入時預先算好的 _created_ord（整數比較）
+        if check_dates:
+            if date_field == 'created' and '_created_ord' in issue:
+                issue_ord = issue['_created_ord']
+            else:
+                # 尚未預先計算的資料（例如舊快取）走原本的解析路徑
+                issue_ord = None
+                date_value = issue.get('fields', {}).get(date_field)
+                if date_value:
+                    try:
+                        issue_ord = parse_issue_date(date_value).toordinal()
+                    except Exception as e:
+                        logger.warning(f"⚠️  日期解析錯誤: {e} (issue: {issue.get('key')}, date: {date_value})")
+
+            # 日期缺失（None）不做日期過濾，維持原本行為
+            if issue_ord is not None and not (start_ord <= issue_ord <= end_ord):
+                continue
+
         # Owner 過濾
         if owner:
-            assignee = fields.get('assignee')
-            if isinstance(assignee, dict):
-                assignee_name = assignee.get('displayName', 'Unassigned')
-            else:
-                assignee_name = 'Unassigned'
-            
+            assignee_name = issue.get('_assignee_name')
+            if assignee_name is None:
+                assignee = issue.get('fields', {}).get('assignee')
+                if isinstance(assignee, dict):
+                    assignee_name = assignee.get('displayName', 'Unassigned')
+                else:
+                    assignee_name = 'Unassigned'
+
             if assignee_name != owner:
                 continue
-        
+
         filtered.append(issue)
-    
+
     return filtered
 
 @app.route('/')
@@ -346,6 +674,169 @@ def index():
     """首頁"""
     return render_template('index.html')
 
+def _stats_etag(cache_ts, start_date, end_date, owner):
+    """由快取時間戳 + 過濾條件產生 ETag；兩者都沒變表示回應內容必然相同"""
+    key = f"{cache_ts}|{start_date}|{end_date}|{owner}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+@functools.lru_cache(maxsize=4096)
+def _week_info_for_ordinal(day_ord):
+    """
+    由日期 ordinal 求該日所屬週次的 (週次鍵, 起訖日期字串)
+    同一週的日期在大量 issues 中重複出現，做 memoize 後每週只算一次
+    """
+    iso = datetime.fromordinal(day_ord).isocalendar()
+    week_start, week_end = get_iso_week_dates(iso[0], iso[1])
+    return (
+        f"{iso[0]}-W{iso[1]:02d}",
+        week_start.strftime('%Y-%m-%d'),
+        week_end.strftime('%Y-%m-%d'),
+        week_start.strftime('%Y-%m-%d %H:%M'),
+        week_end.strftime('%Y-%m-%d %H:%M')
+    )
+
+def _split_by_source(issues):
+    """單次走訪把 issues 分流成 (internal, vendor)；_source 已在載入時正規化"""
+    internal, vendor = [], []
+    for issue in issues:
+        (vendor if issue.get('_source') == 'vendor' else internal).append(issue)
+    return internal, vendor
+
+def _aggregate_issues(columns, start_ord, end_ord, owner):
+    """
+    融合過濾 + 週次統計 + assignee 分布的單趟聚合（kernel fusion）：
+    原本過濾一趟、internal/vendor 分流一趟、六個統計函式再各掃一趟，
+    這裡每個 issue 只摸一次，通過過濾就同步更新所有計數器
+
+    Returns:
+        (filtered, weekly_all, weekly_by_source, assignees_by_source, counts)
+    """
+    filtered = []
+    weekly_all = {}
+    weekly_by_source = {'internal': {}, 'vendor': {}}
+    assignees_by_source = {'internal': Counter(), 'vendor': Counter()}
+    counts = {'internal': 0, 'vendor': 0}
+    repaired = 0
+
+    for day_ord, assignee, issue in columns:
+        # 過濾條件（日期缺失的 issue 不做日期過濾，維持原本行為）
+        if owner and assignee != owner:
+            continue
+        if day_ord is not None and not (start_ord <= day_ord <= end_ord):
+            continue
+
+        filtered.append(issue)
+
+        source = issue.get('_source')
+        if source != 'internal' and source != 'vendor':
+            # 缺漏 _source 標記的 issue 順路用 self URL 判斷來源並修復
+            repaired += 1
+            source = 'vendor' if 'vendorjira' in issue.get('self', '').lower() else 'internal'
+            issue['_source'] = source
+
+        counts[source] += 1
+        assignees_by_source[source][assignee] += 1
+
+        if day_ord is None:
+            continue
+
+        meta = _week_info_for_ordinal(day_ord)
+        week_key = meta[0]
+        issue_key = issue.get('key')
+        for bucket in (weekly_all, weekly_by_source[source]):
+            entry = bucket.get(week_key)
+            if entry is None:
+                entry = bucket[week_key] = {
+                    'count': 0,
+                    'issues': [],
+                    'start_date': meta[1],
+                    'end_date': meta[2],
+                    'start_datetime': meta[3],
+                    'end_datetime': meta[4]
+                }
+            entry['count'] += 1
+            entry['issues'].append(issue_key)
+
+    if repaired:
+        logger.warning(f"⚠️  警告: 有 {repaired} 個 issues 沒有正確的 _source 標記，已修復")
+
+    # 鍵按週次排序，讓下游的線性 merge 成立
+    weekly_all = dict(sorted(weekly_all.items()))
+    weekly_by_source = {s: dict(sorted(w.items())) for s, w in weekly_by_source.items()}
+    assignees_by_source = {s: dict(a) for s, a in assignees_by_source.items()}
+
+    return filtered, weekly_all, weekly_by_source, assignees_by_source, counts
+
+@functools.lru_cache(maxsize=128)
+def _compute_stats(cache_ts, start_date, end_date, owner):
+    """
+    過濾 + 統計管線（/api/stats 的重活都在這裡）
+
+    結果是 (過濾條件, 快取時間戳) 的純函式：cache_ts 參與快取鍵，
+    cache.set() 更新時間戳後舊結果自然失效，輪詢相同條件的儀表板
+    只需做一次 O(N) 掃描，之後都是 dict 查表
+    """
+    # 原子地取得 (data, timestamp) 配對；快取在請求途中被 clear()/重載時
+    # 退回 cache_ts 當時註冊的快照，不會讀到 None 或不一致的資料
+    data, ts = cache.snapshot()
+    if data is None or ts != cache_ts:
+        data = _STATS_SNAPSHOTS.get(cache_ts)
+    if data is None:
+        raise RuntimeError('統計快照已失效，請重新載入資料')
+
+    start_ord = datetime.fromisoformat(start_date).toordinal() if start_date else 0
+    end_ord = datetime.fromisoformat(end_date).toordinal() if end_date else 10 ** 9
+
+    columns = data.get('_columns')
+    if columns is None:
+        # 後備：快取資料沒有 SoA 結構時現場組一份（一般不會走到）
+        columns = {
+            kind: [(i.get('_created_ord'), i.get('_assignee_name', 'Unassigned'), i)
+                   for i in data[kind]]
+            for kind in ('degrade', 'resolved')
+        }
+
+    # degrade / resolved 兩趟融合聚合互相獨立：
+    # degrade 丟到執行緒池、resolved 在本執行緒算，重疊兩邊的等待
+    degrade_future = STATS_EXECUTOR.submit(
+        _aggregate_issues, columns['degrade'], start_ord, end_ord, owner)
+    (filtered_resolved, resolved_weekly, resolved_weekly_by_source,
+     resolved_assignees, resolved_counts) = _aggregate_issues(
+        columns['resolved'], start_ord, end_ord, owner)
+    (filtered_degrade, degrade_weekly, degrade_weekly_by_source,
+     degrade_assignees, degrade_counts) = degrade_future.result()
+
+    logger.debug(f"📊 過濾後: degrade={len(filtered_degrade)}, resolved={len(filtered_resolved)}")
+
+    total_degrade = len(filtered_degrade)
+    total_resolved = len(filtered_resolved)
+    overall_percentage = (total_degrade / total_resolved * 100) if total_resolved > 0 else 0
+
+    weekly_stats = calculate_weekly_percentage(degrade_weekly, resolved_weekly)
+
+    return {
+        'overall': {
+            'degrade_count': total_degrade,
+            'resolved_count': total_resolved,
+            'percentage': round(overall_percentage, 2),
+            'internal': {
+                'degrade_count': degrade_counts['internal'],
+                'resolved_count': resolved_counts['internal']
+            },
+            'vendor': {
+                'degrade_count': degrade_counts['vendor'],
+                'resolved_count': resolved_counts['vendor']
+            }
+        },
+        'weekly': weekly_stats,
+        'weekly_by_source': degrade_weekly_by_source,
+        'weekly_by_source_resolved': resolved_weekly_by_source,
+        'assignees': {
+            'degrade': degrade_assignees,
+            'resolved': resolved_assignees
+        }
+    }
+
 @app.route('/api/stats')
 def get_stats():
     """取得統計資料"""
@@ -356,11 +847,11 @@ def get_stats():
         
         # 確保資料格式正確
         if not isinstance(data.get('degrade'), list):
-            print(f"❌ 錯誤: data['degrade'] 不是列表，類型為 {type(data.get('degrade'))}")
+            logger.error(f"❌ 錯誤: data['degrade'] 不是列表，類型為 {type(data.get('degrade'))}")
             return jsonify({'success': False, 'error': 'degrade 資料格式錯誤'}), 500
         
         if not isinstance(data.get('resolved'), list):
-            print(f"❌ 錯誤: data['resolved'] 不是列表，類型為 {type(data.get('resolved'))}")
+            logger.error(f"❌ 錯誤: data['resolved'] 不是列表，類型為 {type(data.get('resolved'))}")
             return jsonify({'success': False, 'error': 'resolved 資料格式錯誤'}), 500
         
         # 取得過濾參數
@@ -368,121 +859,29 @@ def get_stats():
         end_date = request.args.get('end_date')
         owner = request.args.get('owner')
         
-        print(f"📊 過濾參數: start_date={start_date}, end_date={end_date}, owner={owner}")
-        print(f"📊 原始資料: degrade={len(data['degrade'])}, resolved={len(data['resolved'])}")
-        
-        # 過濾資料 - degrade 使用 created，resolved 使用 created
-        filtered_degrade = filter_issues(data['degrade'], start_date, end_date, owner, date_field='created')
-        filtered_resolved = filter_issues(data['resolved'], start_date, end_date, owner, date_field='created')
-        
-        print(f"📊 過濾後: degrade={len(filtered_degrade)}, resolved={len(filtered_resolved)}")
-        
-        # 確保所有 issues 都有正確的 _source 標記
-        missing_degrade = [i for i in filtered_degrade if i.get('_source') not in ['internal', 'vendor']]
-        missing_resolved = [i for i in filtered_resolved if i.get('_source') not in ['internal', 'vendor']]
-        
-        if missing_degrade:
-            print(f"⚠️  警告: 有 {len(missing_degrade)} 個 degrade issues 沒有正確的 _source 標記，正在修復...")
-            for issue in missing_degrade:
-                if 'vendorjira' in issue.get('self', '').lower():
-                    issue['_source'] = 'vendor'
-                else:
-                    issue['_source'] = 'internal'
-        
-        if missing_resolved:
-            print(f"⚠️  警告: 有 {len(missing_resolved)} 個 resolved issues 沒有正確的 _source 標記，正在修復...")
-            for issue in missing_resolved:
-                if 'vendorjira' in issue.get('self', '').lower():
-                    issue['_source'] = 'vendor'
-                else:
-                    issue['_source'] = 'internal'
-        
-        # 分離內部和 Vendor
-        internal_degrade = [i for i in filtered_degrade if i.get('_source') == 'internal']
-        vendor_degrade = [i for i in filtered_degrade if i.get('_source') == 'vendor']
-        internal_resolved = [i for i in filtered_resolved if i.get('_source') == 'internal']
-        vendor_resolved = [i for i in filtered_resolved if i.get('_source') == 'vendor']
-        
-        # 驗證數量一致性
-        print(f"📊 分離驗證:")
-        print(f"   Degrade: total={len(filtered_degrade)}, internal={len(internal_degrade)}, vendor={len(vendor_degrade)}, sum={len(internal_degrade)+len(vendor_degrade)}")
-        print(f"   Resolved: total={len(filtered_resolved)}, internal={len(internal_resolved)}, vendor={len(vendor_resolved)}, sum={len(internal_resolved)+len(vendor_resolved)}")
-        
-        # 收集所有 assignees
-        all_owners = set()
-        for issue in data['degrade'] + data['resolved']:
-            fields = issue.get('fields', {})
-            assignee = fields.get('assignee')
-            if assignee:
-                all_owners.add(assignee.get('displayName', 'Unassigned'))
-            else:
-                all_owners.add('Unassigned')
-        
-        # 重新統計
-        manager = JiraDegradeManagerFast(
-            site=JIRA_CONFIG['internal']['site'],
-            user=JIRA_CONFIG['internal']['user'],
-            password=JIRA_CONFIG['internal']['password'],
-            token=JIRA_CONFIG['internal']['token']
-        )
-        
-        total_degrade = len(filtered_degrade)
-        total_resolved = len(filtered_resolved)
-        overall_percentage = (total_degrade / total_resolved * 100) if total_resolved > 0 else 0
-        
-        # Assignee 分布
-        degrade_assignees_internal = manager.get_assignee_distribution(internal_degrade)
-        degrade_assignees_vendor = manager.get_assignee_distribution(vendor_degrade)
-        resolved_assignees_internal = manager.get_assignee_distribution(internal_resolved)
-        resolved_assignees_vendor = manager.get_assignee_distribution(vendor_resolved)
-        
-        # 週次統計 - degrade 使用 created，resolved 使用 created
-        degrade_weekly = analyze_by_week_with_dates(filtered_degrade, date_field='created')
-        resolved_weekly = analyze_by_week_with_dates(filtered_resolved, date_field='created')
-        weekly_stats = calculate_weekly_percentage(degrade_weekly, resolved_weekly)
-        
-        degrade_weekly_internal = analyze_by_week_with_dates(internal_degrade, date_field='created')
-        degrade_weekly_vendor = analyze_by_week_with_dates(vendor_degrade, date_field='created')
-        resolved_weekly_internal = analyze_by_week_with_dates(internal_resolved, date_field='created')
-        resolved_weekly_vendor = analyze_by_week_with_dates(vendor_resolved, date_field='created')
-        
-        return jsonify({
+        logger.debug(f"📊 過濾參數: start_date={start_date}, end_date={end_date}, owner={owner}")
+        logger.debug(f"📊 原始資料: degrade={len(data['degrade'])}, resolved={len(data['resolved'])}")
+
+        # 用這份資料自己的 timestamp 查統計，途中發生 cache.clear() 也不受影響
+        cache_ts = data.get('_cache_ts', cache.timestamp)
+
+        # 資料和過濾條件都沒變的話，輪詢直接回 304（省掉序列化和傳輸整包 payload）
+        etag = _stats_etag(cache_ts, start_date, end_date, owner)
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304, {'ETag': etag}
+
+        # 所有 assignees 已在 load_data() 時收集好，不需每次重新掃描
+        all_owners = data['_all_owners']
+
+        # 過濾 + 統計（相同過濾條件的重複查詢直接命中快取）
+        stats = _compute_stats(cache_ts, start_date, end_date, owner)
+
+        response = ojsonify({
             'success': True,
             'data': {
-                'overall': {
-                    'degrade_count': total_degrade,
-                    'resolved_count': total_resolved,
-                    'percentage': round(overall_percentage, 2),
-                    'internal': {
-                        'degrade_count': len(internal_degrade),
-                        'resolved_count': len(internal_resolved)
-                    },
-                    'vendor': {
-                        'degrade_count': len(vendor_degrade),
-                        'resolved_count': len(vendor_resolved)
-                    }
-                },
-                'weekly': weekly_stats,
-                'weekly_by_source': {
-                    'internal': degrade_weekly_internal,
-                    'vendor': degrade_weekly_vendor
-                },
-                'weekly_by_source_resolved': {
-                    'internal': resolved_weekly_internal,
-                    'vendor': resolved_weekly_vendor
-                },
-                'assignees': {
-                    'degrade': {
-                        'internal': degrade_assignees_internal,
-                        'vendor': degrade_assignees_vendor
-                    },
-                    'resolved': {
-                        'internal': resolved_assignees_internal,
-                        'vendor': resolved_assignees_vendor
-                    }
-                },
+                **stats,
                 'jira_sites': data['jira_sites'],
-                'all_owners': sorted(list(all_owners)),
+                'all_owners': all_owners,
                 'filters': {
                     'start_date': start_date,
                     'end_date': end_date,
@@ -494,9 +893,12 @@ def get_stats():
                 'warnings': data['metadata'].get('warnings', [])
             }
         })
-        
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = 'private, max-age=10'
+        return response
+
     except Exception as e:
-        print(f"❌ API 錯誤: {e}")
+        logger.error(f"❌ API 錯誤: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -506,29 +908,50 @@ def get_stats():
 # MTTR 專用快取
 mttr_cache = DataCache(ttl_seconds=int(os.getenv('CACHE_TTL', 3600)))
 
+@functools.lru_cache(maxsize=None)
+def _get_manager(source):
+    """延遲建立、整個行程共用的 JIRA manager（每個來源一個，不必每次重載都重建）"""
+    cfg = JIRA_CONFIG[source]
+    return JiraDegradeManagerFast(
+        site=cfg['site'],
+        user=cfg['user'],
+        password=cfg['password'],
+        token=cfg['token']
+    )
+
+def _precompute_mttr_issue(issue):
+    """
+    為 MTTR issue 附加預先解析的 datetime 欄位，
+    calculate_mttr_metrics 每次請求都會用到這三個日期，
+    載入時解析一次掛在 issue 上，之後直接讀屬性：
+    - _created_dt / _resolved_dt / _due_dt: 解析後的 datetime（欄位缺漏為 None）
+    - 並沿用 _precompute_issue 的 _created_ord/_iso_week_key/_assignee_name
+    """
+    _precompute_issue(issue)
+    fields = issue.get('fields', {})
+    for field, key in (('created', '_created_dt'),
+                       ('resolutiondate', '_resolved_dt'),
+                       ('duedate', '_due_dt')):
+        value = fields.get(field)
+        if value:
+            try:
+                issue[key] = parse_issue_date(value)
+            except Exception:
+                issue[key] = None
+        else:
+            issue[key] = None
+
 def load_mttr_data():
     """載入 MTTR 資料"""
     if not MTTR_ENABLED:
         return None
 
     try:
-        print("📥 開始載入 MTTR 資料...")
-        from jira_degrade_manager import JiraDegradeManagerFast
-
-        # 建立 JIRA managers
-        internal_jira = JiraDegradeManagerFast(
-            site=JIRA_CONFIG['internal']['site'],
-            user=JIRA_CONFIG['internal']['user'],
-            password=JIRA_CONFIG['internal']['password'],
-            token=JIRA_CONFIG['internal']['token']
-        )
+        logger.info("📥 開始載入 MTTR 資料...")
 
-        vendor_jira = JiraDegradeManagerFast(
-            site=JIRA_CONFIG['vendor']['site'],
-            user=JIRA_CONFIG['vendor']['user'],
-            password=JIRA_CONFIG['vendor']['password'],
-            token=JIRA_CONFIG['vendor']['token']
-        )
+        # 共用行程級的 JIRA managers
+        internal_jira = _get_manager('internal')
+        vendor_jira = _get_manager('vendor')
 
         results = {}
         warnings = []
@@ -545,42 +968,40 @@ def load_mttr_data():
         if MTTR_FILTERS['open']['vendor']:
             tasks.append(('open_vendor', vendor_jira, MTTR_FILTERS['open']['vendor'], 'vendor', 'open'))
 
-        # 並行載入
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_task = {
-                executor.submit(jira.get_filter_issues_fast, filter_id): (task_name, source, type_name)
-                for task_name, jira, filter_id, source, type_name in tasks
-            }
+        # 並行載入（共用行程級的 I/O 執行緒池，不必每次都重新開執行緒）
+        future_to_task = {
+            IO_EXECUTOR.submit(jira.get_filter_issues_fast, filter_id): (task_name, source, type_name)
+            for task_name, jira, filter_id, source, type_name in tasks
+        }
 
-            for future in as_completed(future_to_task):
-                task_name, source, type_name = future_to_task[future]
-                try:
-                    result = future.result()
-
-                    if result['success']:
-                        # 標記來源
-                        for issue in result['issues']:
-                            issue['_source'] = source
-                        results[task_name] = result['issues']
-                    else:
-                        results[task_name] = []
-                        warnings.append({
-                            'source': source,
-                            'type': type_name,
-                            'site': result.get('site', ''),
-                            'filter_id': result.get('filter_id', ''),
-                            'filter_owner': result.get('filter_owner', 'Unknown'),
-                            'error': result.get('error', '未知錯誤'),
-                            'error_type': result.get('error_type', 'UNKNOWN_ERROR')
-                        })
-                except Exception as e:
-                    print(f"  ❌ MTTR {task_name} 失敗: {e}")
+        for future in as_completed(future_to_task):
+            task_name, source, type_name = future_to_task[future]
+            try:
+                result = future.result()
+
+                if result['success']:
+                    # 標記來源 + 預解析日期欄位（之後的統計不再碰字串）
+                    for issue in result['issues']:
+                        issue['_source'] = source
+                        _precompute_mttr_issue(issue)
+                    results[task_name] = result['issues']
+                else:
                     results[task_name] = []
+                    warnings.append({
+                        'source': source,
+                        'type': type_name,
+                        'site': result.get('site', ''),
+                        'filter_id': result.get('filter_id', ''),
+                        'filter_owner': result.get('filter_owner', 'Unknown'),
+                        'error': result.get('error', '未知錯誤'),
+                        'error_type': result.get('error_type', 'UNKNOWN_ERROR')
+                    })
+            except Exception as e:
+                logger.error(f"  ❌ MTTR {task_name} 失敗: {e}")
+                results[task_name] = []
 
         total_time = time.time() - start_time
-        print(f"✅ MTTR 資料載入完成！耗時: {total_time:.1f} 秒")
+        logger.info(f"✅ MTTR 資料載入完成！耗時: {total_time:.1f} 秒")
 
         data = {
             'resolved': {
@@ -591,10 +1012,7 @@ def load_mttr_data():
                 'internal': results.get('open_internal', []),
                 'vendor': results.get('open_vendor', [])
             },
-            'jira_sites': {
-                'internal': JIRA_CONFIG['internal']['site'],
-                'vendor': JIRA_CONFIG['vendor']['site']
-            },
+            'jira_sites': JIRA_SITES,
             'metadata': {
                 'load_time': total_time,
                 'timestamp': datetime.now().isoformat(),
@@ -602,25 +1020,103 @@ def load_mttr_data():
             }
         }
 
+        # assignee 清單只在載入時變動，這裡收集一次，/api/mttr/stats 不必每次重掃
+        data['_all_owners'] = sorted({
+            issue['_assignee_name']
+            for issue in itertools.chain(
+                data['resolved']['internal'], data['resolved']['vendor'],
+                data['open']['internal'], data['open']['vendor']
+            )
+        })
+
         mttr_cache.set(data)
+        # timestamp 跟著資料走：過濾快取與 ETag 用資料自己的 timestamp 當鍵，
+        # 背景重載（SWR）完成的瞬間不會把舊資料掛在新 timestamp 底下
+        data['_cache_ts'] = mttr_cache.timestamp
         return data
 
     except Exception as e:
-        print(f"❌ MTTR 載入資料失敗: {e}")
+        logger.error(f"❌ MTTR 載入資料失敗: {e}")
         import traceback
         traceback.print_exc()
         return None
 
+# MTTR 重載專用的單一 worker 執行緒池：
+# 與主資料的 REFRESH_POOL 分開，兩邊的重載不會互相排隊
+MTTR_REFRESH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mttr-refresh')
+_mttr_refresh_future = None
+_mttr_refresh_lock = threading.Lock()
+
+def _submit_mttr_refresh():
+    """
+    提交一次 MTTR 重載，回傳 (future, started)
+    已有重載進行中時直接回傳進行中的 Future（started=False），不重複排隊
+    """
+    global _mttr_refresh_future
+    with _mttr_refresh_lock:
+        if _mttr_refresh_future is not None and not _mttr_refresh_future.done():
+            return _mttr_refresh_future, False
+        _mttr_refresh_future = MTTR_REFRESH_POOL.submit(load_mttr_data)
+        return _mttr_refresh_future, True
+
 def get_mttr_data():
-    """取得 MTTR 資料（優先使用快取）"""
+    """取得 MTTR 資料（優先使用快取；TTL 過期先回舊資料並於背景更新）"""
     data = mttr_cache.get()
     if data:
         age = mttr_cache.age()
-        print(f"✓ 使用 MTTR 快取 (年齡: {age:.0f}秒)")
+        logger.debug(f"✓ 使用 MTTR 快取 (年齡: {age:.0f}秒)")
         return data
 
-    print("⚠ MTTR 快取無效，重新載入...")
-    return load_mttr_data()
+    # stale-while-revalidate：過期但未超過 hard_ttl 的資料先回給前端，不阻塞請求
+    stale = mttr_cache.get_stale()
+    if stale is not None:
+        logger.warning("⚠ MTTR 快取過期，先回傳舊資料並於背景重新載入...")
+        _submit_mttr_refresh()
+        return stale
+
+    # 冷啟動 dogpile 防護：同時 miss 的請求共用同一個載入 Future
+    logger.warning("⚠ MTTR 快取無效，重新載入...")
+    future, _ = _submit_mttr_refresh()
+    return future.result()
+
+def _unpack_mttr_stats(stats):
+    """單趟走訪把 MTTR 週次統計拆成四個 JSON 陣列字串（labels/mttr/overdue/count）"""
+    labels, mttr, overdue, counts = [], [], [], []
+    get = itemgetter('week', 'avg_mttr_days', 'avg_overdue_days', 'count')
+    for w in stats:
+        week, avg_mttr, avg_overdue, count = get(w)
+        labels.append(week)
+        mttr.append(avg_mttr)
+        overdue.append(avg_overdue)
+        counts.append(count)
+    return _dumps(labels), _dumps(mttr), _dumps(overdue), _dumps(counts)
+
+# (MTTR 資料時間戳, 過濾條件) → 四份過濾後列表：
+# /api/mttr/stats 與 Excel/HTML 匯出要的是同一組過濾結果，同條件只掃一次；
+# 鍵含 mttr_cache.timestamp，資料重載後舊項目自然失效，FIFO 淘汰控制記憶體
+_MTTR_FILTER_CACHE = {}
+_MTTR_FILTER_CACHE_LOCK = threading.Lock()
+_MTTR_FILTER_CACHE_MAX = 8
+
+def get_mttr_filtered(data, start_date, end_date, owner):
+    """回傳 (resolved_internal, resolved_vendor, open_internal, open_vendor) 四份過濾結果"""
+    key = (data.get('_cache_ts', mttr_cache.timestamp), start_date, end_date, owner)
+    with _MTTR_FILTER_CACHE_LOCK:
+        cached = _MTTR_FILTER_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = tuple(
+        filter_issues(data[kind][source], start_date, end_date, owner, date_field='created')
+        for kind in ('resolved', 'open')
+        for source in ('internal', 'vendor')
+    )
+
+    with _MTTR_FILTER_CACHE_LOCK:
+        if len(_MTTR_FILTER_CACHE) >= _MTTR_FILTER_CACHE_MAX:
+            _MTTR_FILTER_CACHE.pop(next(iter(_MTTR_FILTER_CACHE)))
+        _MTTR_FILTER_CACHE[key] = result
+    return result
 
 def calculate_mttr_metrics(issues, metric_type='resolved'):
     """
@@ -637,100 +1133,80 @@ def calculate_mttr_metrics(issues, metric_type='resolved'):
     now = datetime.now()
 
     for issue in issues:
-        fields = issue.get('fields', {})
-        created_str = fields.get('created')
+        # 舊的 pickle 快取可能還沒有預解析欄位，這裡補算一次（會留在快取上）
+        if '_created_dt' not in issue:
+            _precompute_mttr_issue(issue)
 
-        if not created_str:
+        created_date = issue['_created_dt']
+        if created_date is None:
             continue
 
         try:
-            # 解析 created 日期
-            if 'T' in created_str:
-                created_date = datetime.fromisoformat(created_str.replace('Z', '+00:00').split('.')[0])
-            else:
-                created_date = datetime.strptime(created_str[:10], '%Y-%m-%d')
-
-            # 計算 ISO 週次
-            iso_calendar = created_date.isocalendar()
-            iso_year = iso_calendar[0]
-            iso_week = iso_calendar[1]
-            week_key = f"{iso_year}-W{iso_week:02d}"
-
-            if week_key not in weekly_stats:
-                week_start, week_end = get_iso_week_dates(iso_year, iso_week)
-                weekly_stats[week_key] = {
+            week_key = issue['_iso_week_key']
+
+            # 桶引用只查一次，迴圈內其餘操作都走 local 變數，省掉重複的 dict 查找
+            bucket = weekly_stats.get(week_key)
+            if bucket is None:
+                # 起訖日期字串沿用 memoize 過的週次資訊，不必每週重新 strftime
+                _, week_start_str, week_end_str, _, _ = _week_info_for_ordinal(issue['_created_ord'])
+                bucket = weekly_stats[week_key] = {
                     'count': 0,
                     'total_mttr_days': 0,
                     'mttr_issues': [],
                     'overdue_count': 0,
                     'total_overdue_days': 0,
                     'overdue_issues': [],
-                    'start_date': week_start.strftime('%Y-%m-%d'),
-                    'end_date': week_end.strftime('%Y-%m-%d')
+                    'start_date': week_start_str,
+                    'end_date': week_end_str
                 }
 
-            weekly_stats[week_key]['count'] += 1
+            bucket['count'] += 1
 
             if metric_type == 'resolved':
                 # 已解掉的問題: MTTR = Resolved - Created
-                resolved_str = fields.get('resolutiondate')
-                if resolved_str:
-                    if 'T' in resolved_str:
-                        resolved_date = datetime.fromisoformat(resolved_str.replace('Z', '+00:00').split('.')[0])
-                    else:
-                        resolved_date = datetime.strptime(resolved_str[:10], '%Y-%m-%d')
-
+                resolved_date = issue['_resolved_dt']
+                if resolved_date is not None:
                     mttr_days = (resolved_date - created_date).days
-                    weekly_stats[week_key]['total_mttr_days'] += mttr_days
-                    weekly_stats[week_key]['mttr_issues'].append({
+                    bucket['total_mttr_days'] += mttr_days
+                    bucket['mttr_issues'].append({
                         'key': issue.get('key'),
                         'mttr_days': mttr_days
                     })
 
                     # Overdue: Resolved - Duedate (duedate 為空則不計)
-                    duedate_str = fields.get('duedate')
-                    if duedate_str:
-                        if 'T' in duedate_str:
-                            duedate = datetime.fromisoformat(duedate_str.replace('Z', '+00:00').split('.')[0])
-                        else:
-                            duedate = datetime.strptime(duedate_str[:10], '%Y-%m-%d')
-
+                    duedate = issue['_due_dt']
+                    if duedate is not None:
                         overdue_days = (resolved_date - duedate).days
                         if overdue_days > 0:
-                            weekly_stats[week_key]['overdue_count'] += 1
-                            weekly_stats[week_key]['total_overdue_days'] += overdue_days
-                            weekly_stats[week_key]['overdue_issues'].append({
+                            bucket['overdue_count'] += 1
+                            bucket['total_overdue_days'] += overdue_days
+                            bucket['overdue_issues'].append({
                                 'key': issue.get('key'),
                                 'overdue_days': overdue_days
                             })
             else:
                 # 尚未解掉的問題: MTTR(ongoing) = Now - Created
                 mttr_days = (now - created_date).days
-                weekly_stats[week_key]['total_mttr_days'] += mttr_days
-                weekly_stats[week_key]['mttr_issues'].append({
+                bucket['total_mttr_days'] += mttr_days
+                bucket['mttr_issues'].append({
                     'key': issue.get('key'),
                     'mttr_days': mttr_days
                 })
 
                 # Overdue(ongoing): Now - Duedate (duedate 為空則不計)
-                duedate_str = fields.get('duedate')
-                if duedate_str:
-                    if 'T' in duedate_str:
-                        duedate = datetime.fromisoformat(duedate_str.replace('Z', '+00:00').split('.')[0])
-                    else:
-                        duedate = datetime.strptime(duedate_str[:10], '%Y-%m-%d')
-
+                duedate = issue['_due_dt']
+                if duedate is not None:
                     overdue_days = (now - duedate).days
                     if overdue_days > 0:
-                        weekly_stats[week_key]['overdue_count'] += 1
-                        weekly_stats[week_key]['total_overdue_days'] += overdue_days
-                        weekly_stats[week_key]['overdue_issues'].append({
+                        bucket['overdue_count'] += 1
+                        bucket['total_overdue_days'] += overdue_days
+                        bucket['overdue_issues'].append({
                             'key': issue.get('key'),
                             'overdue_days': overdue_days
                         })
 
         except Exception as e:
-            print(f"⚠️  MTTR 計算錯誤: {e} (issue: {issue.get('key')})")
+            logger.warning(f"⚠️  MTTR 計算錯誤: {e} (issue: {issue.get('key')})")
             continue
 
     # 計算平均值
@@ -776,13 +1252,19 @@ def get_mttr_stats():
         end_date = request.args.get('end_date')
         owner = request.args.get('owner')
 
-        print(f"📊 MTTR 過濾參數: start_date={start_date}, end_date={end_date}, owner={owner}")
+        logger.debug(f"📊 MTTR 過濾參數: start_date={start_date}, end_date={end_date}, owner={owner}")
+
+        # 資料和過濾條件沒變的輪詢直接回 304；
+        # open 指標會隨時間老化，ETag 鍵加上今天日期，最多凍結到跨日
+        etag = _stats_etag(
+            f"{data.get('_cache_ts', mttr_cache.timestamp)}|{datetime.now().strftime('%Y-%m-%d')}",
+            start_date, end_date, owner)
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304, {'ETag': etag}
 
         # 過濾資料 (使用 created 欄位)
-        resolved_internal = filter_issues(data['resolved']['internal'], start_date, end_date, owner, date_field='created')
-        resolved_vendor = filter_issues(data['resolved']['vendor'], start_date, end_date, owner, date_field='created')
-        open_internal = filter_issues(data['open']['internal'], start_date, end_date, owner, date_field='created')
-        open_vendor = filter_issues(data['open']['vendor'], start_date, end_date, owner, date_field='created')
+        resolved_internal, resolved_vendor, open_internal, open_vendor = \
+            get_mttr_filtered(data, start_date, end_date, owner)
 
         # 合併資料
         all_resolved = resolved_internal + resolved_vendor
@@ -797,18 +1279,10 @@ def get_mttr_stats():
         open_stats_vendor = calculate_mttr_metrics(open_vendor, 'open')
         open_stats_all = calculate_mttr_metrics(all_open, 'open')
 
-        # 收集所有 assignees
-        all_owners = set()
-        for issues in [resolved_internal, resolved_vendor, open_internal, open_vendor]:
-            for issue in issues:
-                fields = issue.get('fields', {})
-                assignee = fields.get('assignee')
-                if assignee:
-                    all_owners.add(assignee.get('displayName', 'Unassigned'))
-                else:
-                    all_owners.add('Unassigned')
+        # 所有 assignees 已在 load_mttr_data() 時收集好
+        all_owners = data['_all_owners']
 
-        return jsonify({
+        response = ojsonify({
             'success': True,
             'data': {
                 'resolved': {
@@ -833,7 +1307,7 @@ def get_mttr_stats():
                 },
                 'jira_sites': data['jira_sites'],
                 'filter_ids': MTTR_FILTERS,
-                'all_owners': sorted(list(all_owners)),
+                'all_owners': all_owners,
                 'filters': {
                     'start_date': start_date,
                     'end_date': end_date,
@@ -844,9 +1318,12 @@ def get_mttr_stats():
                 'warnings': data['metadata'].get('warnings', [])
             }
         })
+        response.headers['ETag'] = etag
+        response.headers['Cache-Control'] = 'private, max-age=10'
+        return response
 
     except Exception as e:
-        print(f"❌ MTTR API 錯誤: {e}")
+        logger.error(f"❌ MTTR API 錯誤: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -859,7 +1336,9 @@ def refresh_mttr():
 
     try:
         mttr_cache.clear()
-        data = load_mttr_data()
+        # 走單一航班的重載：連點或多人同按也只打一次 JIRA
+        future, _ = _submit_mttr_refresh()
+        data = future.result()
         if data:
             return jsonify({'success': True, 'message': 'MTTR 資料重新載入完成'})
         else:
@@ -874,6 +1353,7 @@ def cache_status():
     mttr_age = mttr_cache.age() if MTTR_ENABLED else None
     return jsonify({
         'valid': age is not None and age < cache.ttl,
+        'refreshing': is_refreshing(),
         'age_seconds': age,
         'age_minutes': age / 60 if age else None,
         'mttr_valid': mttr_age is not None and mttr_age < mttr_cache.ttl if MTTR_ENABLED else None,
@@ -884,9 +1364,26 @@ def cache_status():
 @app.route('/api/refresh', methods=['POST'])
 def refresh():
     """強制重新載入資料"""
+    global _last_forced_refresh
     try:
-        cache.clear()
-        data = load_data()
+        # 最小間隔限制：保護上游 JIRA 配額
+        elapsed = time.time() - _last_forced_refresh
+        if elapsed < MIN_REFRESH_INTERVAL:
+            retry_after = int(MIN_REFRESH_INTERVAL - elapsed) + 1
+            response = jsonify({
+                'success': False,
+                'error': f'重新整理太頻繁，請 {retry_after} 秒後再試'
+            })
+            response.headers['Retry-After'] = str(retry_after)
+            return response, 429
+
+        future, started = _submit_refresh(_force_reload)
+        if not started:
+            return jsonify({'success': False, 'error': '重新載入已在進行中，請稍候'}), 429
+        _last_forced_refresh = time.time()
+
+        # 維持同步語意：前端 await 這個請求完成後才重新抓統計
+        data = future.result()
         if data:
             return jsonify({'success': True, 'message': '資料重新載入完成'})
         else:
@@ -911,78 +1408,76 @@ def export_excel():
         filtered_degrade = filter_issues(data['degrade'], start_date, end_date, owner, date_field='created')
         filtered_resolved = filter_issues(data['resolved'], start_date, end_date, owner, date_field='created')
         
-        # 建立 Excel
-        wb = Workbook()
-        wb.remove(wb.active)  # 移除預設工作表
-        
-        # 樣式定義
+        # 建立 Excel - write-only 模式逐列寫出，不在記憶體建整張表的 DOM
+        wb = Workbook(write_only=True)
+
+        # 樣式定義（write-only 模式只對表頭列配置樣式物件）
         header_font = Font(bold=True, color='FFFFFF', size=11)
         header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
         header_alignment = Alignment(horizontal='center', vertical='center')
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        def create_sheet(wb, title, data, columns, source_filter=None):
-            """建立工作表"""
-            ws = wb.create_sheet(title=title)
-            
-            # 過濾資料
-            if source_filter:
-                data = [i for i in data if i.get('_source') == source_filter]
-            
-            # 寫入標題
-            for col_idx, (header, _) in enumerate(columns, 1):
-                cell = ws.cell(row=1, column=col_idx, value=header)
+
+        def make_header_row(ws, headers):
+            """產生套用樣式的表頭列"""
+            cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
                 cell.font = header_font
                 cell.fill = header_fill
                 cell.alignment = header_alignment
-                cell.border = border
-            
-            # 寫入資料
-            for row_idx, issue in enumerate(data, 2):
-                fields = issue.get('fields', {})
-                for col_idx, (_, field_func) in enumerate(columns, 1):
-                    value = field_func(issue, fields)
-                    cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                    cell.border = border
-            
-            # 自動調整欄寬
-            for col_idx in range(1, len(columns) + 1):
-                ws.column_dimensions[get_column_letter(col_idx)].width = 15
-            
-            # 啟用篩選
-            ws.auto_filter.ref = ws.dimensions
-            
+                cells.append(cell)
+            return cells
+
+        def create_sheet(wb, title, rows, headers, source_filter=None):
+            """建立工作表（rows 已預先渲染；欄寬與篩選範圍要在寫入前設定）"""
+            # 各來源工作表共用同一份 rows，只做一次便宜的 Source 欄比對
+            if source_filter:
+                tag = source_filter.upper()
+                rows = [r for r in rows if r[-1] == tag]
+
+            ws = wb.create_sheet(title=title)
+
+            # 欄寬（write-only 模式要在 append 前設定）
+            for col_idx in range(1, len(headers) + 1):
+                ws.column_dimensions[get_column_letter(col_idx)].width = 15
+
+            # 啟用篩選（write-only 沒有 ws.dimensions，自行計算範圍）
+            ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{len(rows) + 1}"
+
+            # 寫入標題與資料
+            ws.append(make_header_row(ws, headers))
+            for row in rows:
+                ws.append(row)
+
             return ws
-        
-        # 定義欄位 - degrade 使用 created，resolved 使用 created
-        degrade_columns = [
-            ('Issue Key', lambda i, f: i.get('key', '')),
-            ('Assignee', lambda i, f: f.get('assignee', {}).get('displayName', 'Unassigned') if f.get('assignee') else 'Unassigned'),
-            ('Created', lambda i, f: f.get('created', '')[:10] if f.get('created') else ''),
-            ('Week', lambda i, f: f"{datetime.strptime(f.get('created', '')[:10], '%Y-%m-%d').isocalendar()[0]}-W{datetime.strptime(f.get('created', '')[:10], '%Y-%m-%d').isocalendar()[1]:02d}" if f.get('created') else ''),
-            ('Source', lambda i, f: i.get('_source', 'unknown').upper())
-        ]
-        
-        resolved_columns = [
-            ('Issue Key', lambda i, f: i.get('key', '')),
-            ('Assignee', lambda i, f: f.get('assignee', {}).get('displayName', 'Unassigned') if f.get('assignee') else 'Unassigned'),
-            ('Resolved Date', lambda i, f: f.get('created', '')[:10] if f.get('created') else ''),
-            ('Week', lambda i, f: f"{datetime.strptime(f.get('created', '')[:10], '%Y-%m-%d').isocalendar()[0]}-W{datetime.strptime(f.get('created', '')[:10], '%Y-%m-%d').isocalendar()[1]:02d}" if f.get('created') else ''),
-            ('Source', lambda i, f: i.get('_source', 'unknown').upper())
-        ]
-        
+
+        def build_issue_rows(issues):
+            """Degrade/Resolved 工作表的列 tuple：直接讀載入時算好的欄位，沒有 lambda 呼叫"""
+            rows = []
+            for issue in issues:
+                created = issue.get('fields', {}).get('created', '')
+                rows.append((
+                    issue.get('key', ''),
+                    issue.get('_assignee_name', 'Unassigned'),
+                    created[:10] if created else '',
+                    issue.get('_iso_week_key') or '',
+                    issue.get('_source', 'unknown').upper()
+                ))
+            return rows
+
+        # 列內容各渲染一次，三張工作表（All/Internal/Vendor）共用
+        # degrade 使用 created，resolved 使用 created
+        degrade_headers = ['Issue Key', 'Assignee', 'Created', 'Week', 'Source']
+        resolved_headers = ['Issue Key', 'Assignee', 'Resolved Date', 'Week', 'Source']
+        degrade_rows = build_issue_rows(filtered_degrade)
+        resolved_rows = build_issue_rows(filtered_resolved)
+
         # 建立工作表
-        create_sheet(wb, 'Degrade All', filtered_degrade, degrade_columns)
-        create_sheet(wb, 'Degrade Internal', filtered_degrade, degrade_columns, 'internal')
-        create_sheet(wb, 'Degrade Vendor', filtered_degrade, degrade_columns, 'vendor')
-        create_sheet(wb, 'Resolved All', filtered_resolved, resolved_columns)
-        create_sheet(wb, 'Resolved Internal', filtered_resolved, resolved_columns, 'internal')
-        create_sheet(wb, 'Resolved Vendor', filtered_resolved, resolved_columns, 'vendor')
+        create_sheet(wb, 'Degrade All', degrade_rows, degrade_headers)
+        create_sheet(wb, 'Degrade Internal', degrade_rows, degrade_headers, 'internal')
+        create_sheet(wb, 'Degrade Vendor', degrade_rows, degrade_headers, 'vendor')
+        create_sheet(wb, 'Resolved All', resolved_rows, resolved_headers)
+        create_sheet(wb, 'Resolved Internal', resolved_rows, resolved_headers, 'internal')
+        create_sheet(wb, 'Resolved Vendor', resolved_rows, resolved_headers, 'vendor')
 
         # ===== MTTR 資料 =====
         mttr_summary_data = []
@@ -990,118 +1485,120 @@ def export_excel():
             mttr_data = get_mttr_data()
             if mttr_data:
                 # 過濾 MTTR 資料
-                mttr_resolved_internal = filter_issues(mttr_data['resolved']['internal'], start_date, end_date, owner, date_field='created')
-                mttr_resolved_vendor = filter_issues(mttr_data['resolved']['vendor'], start_date, end_date, owner, date_field='created')
-                mttr_open_internal = filter_issues(mttr_data['open']['internal'], start_date, end_date, owner, date_field='created')
-                mttr_open_vendor = filter_issues(mttr_data['open']['vendor'], start_date, end_date, owner, date_field='created')
-
-                mttr_all_resolved = mttr_resolved_internal + mttr_resolved_vendor
-                mttr_all_open = mttr_open_internal + mttr_open_vendor
-
-                # MTTR 欄位定義
-                def calc_mttr_resolved(issue, fields):
-                    """計算已解決問題的 MTTR"""
-                    created = fields.get('created', '')
-                    resolved = fields.get('resolutiondate', '')
-                    if created and resolved:
-                        try:
-                            created_dt = datetime.fromisoformat(created.split('.')[0].replace('Z', ''))
-                            resolved_dt = datetime.fromisoformat(resolved.split('.')[0].replace('Z', ''))
-                            return (resolved_dt - created_dt).days
-                        except:
-                            pass
-                    return ''
-
-                def calc_overdue_resolved(issue, fields):
-                    """計算已解決問題的 Overdue 天數"""
-                    resolved = fields.get('resolutiondate', '')
-                    duedate = fields.get('duedate', '')
-                    if resolved and duedate:
-                        try:
-                            resolved_dt = datetime.fromisoformat(resolved.split('.')[0].replace('Z', ''))
-                            due_dt = datetime.strptime(duedate[:10], '%Y-%m-%d')
-                            days = (resolved_dt - due_dt).days
-                            return days if days > 0 else 0
-                        except:
-                            pass
-                    return ''
-
-                def calc_mttr_open(issue, fields):
-                    """計算未解決問題的 MTTR(ongoing)"""
-                    created = fields.get('created', '')
-                    if created:
-                        try:
-                            created_dt = datetime.fromisoformat(created.split('.')[0].replace('Z', ''))
-                            return (datetime.now() - created_dt).days
-                        except:
-                            pass
-                    return ''
-
-                def calc_overdue_open(issue, fields):
-                    """計算未解決問題的 Overdue 天數"""
-                    duedate = fields.get('duedate', '')
-                    if duedate:
-                        try:
-                            due_dt = datetime.strptime(duedate[:10], '%Y-%m-%d')
-                            days = (datetime.now() - due_dt).days
-                            return days if days > 0 else 0
-                        except:
-                            pass
-                    return ''
-
-                mttr_resolved_columns = [
-                    ('Issue Key', lambda i, f: i.get('key', '')),
-                    ('Assignee', lambda i, f: f.get('assignee', {}).get('displayName', 'Unassigned') if f.get('assignee') else 'Unassigned'),
-                    ('Created', lambda i, f: f.get('created', '')[:10] if f.get('created') else ''),
-                    ('Resolved', lambda i, f: f.get('resolutiondate', '')[:10] if f.get('resolutiondate') else ''),
-                    ('Due Date', lambda i, f: f.get('duedate', '')[:10] if f.get('duedate') else ''),
-                    ('MTTR (Days)', calc_mttr_resolved),
-                    ('Overdue (Days)', calc_overdue_resolved),
-                    ('Source', lambda i, f: i.get('_source', 'unknown').upper())
-                ]
-
-                mttr_open_columns = [
-                    ('Issue Key', lambda i, f: i.get('key', '')),
-                    ('Assignee', lambda i, f: f.get('assignee', {}).get('displayName', 'Unassigned') if f.get('assignee') else 'Unassigned'),
-                    ('Created', lambda i, f: f.get('created', '')[:10] if f.get('created') else ''),
-                    ('Due Date', lambda i, f: f.get('duedate', '')[:10] if f.get('duedate') else ''),
-                    ('MTTR Ongoing (Days)', calc_mttr_open),
-                    ('Overdue (Days)', calc_overdue_open),
-                    ('Source', lambda i, f: i.get('_source', 'unknown').upper())
-                ]
+                mttr_resolved_internal, mttr_resolved_vendor, mttr_open_internal, mttr_open_vendor = \
+                    get_mttr_filtered(mttr_data, start_date, end_date, owner)
+
+                # MTTR 列渲染：直接讀載入時預解析的 datetime 欄位組 tuple，
+                # 沒有 per-cell lambda 呼叫，也不再於每列重新解析日期字串
+                now = datetime.now()
+
+                def build_mttr_resolved_rows(issues):
+                    """MTTR Resolved 工作表的列 tuple"""
+                    rows = []
+                    for issue in issues:
+                        if '_created_dt' not in issue:  # 舊快取補算
+                            _precompute_mttr_issue(issue)
+                        fields = issue.get('fields', {})
+                        created_dt = issue['_created_dt']
+                        resolved_dt = issue['_resolved_dt']
+                        due_dt = issue['_due_dt']
+
+                        mttr_days = ''
+                        if created_dt is not None and resolved_dt is not None:
+                            mttr_days = (resolved_dt - created_dt).days
+
+                        overdue_days = ''
+                        if resolved_dt is not None and due_dt is not None:
+                            overdue_days = max((resolved_dt - due_dt).days, 0)
+
+                        rows.append((
+                            issue.get('key', ''),
+                            issue.get('_assignee_name', 'Unassigned'),
+                            (fields.get('created') or '')[:10],
+                            (fields.get('resolutiondate') or '')[:10],
+                            (fields.get('duedate') or '')[:10],
+                            mttr_days,
+                            overdue_days,
+                            issue.get('_source', 'unknown').upper()
+                        ))
+                    return rows
+
+                def build_mttr_open_rows(issues):
+                    """MTTR Open 工作表的列 tuple（now 只取一次，整份匯出基準一致）"""
+                    rows = []
+                    for issue in issues:
+                        if '_created_dt' not in issue:  # 舊快取補算
+                            _precompute_mttr_issue(issue)
+                        fields = issue.get('fields', {})
+                        created_dt = issue['_created_dt']
+                        due_dt = issue['_due_dt']
+
+                        mttr_days = ''
+                        if created_dt is not None:
+                            mttr_days = (now - created_dt).days
+
+                        overdue_days = ''
+                        if due_dt is not None:
+                            overdue_days = max((now - due_dt).days, 0)
+
+                        rows.append((
+                            issue.get('key', ''),
+                            issue.get('_assignee_name', 'Unassigned'),
+                            (fields.get('created') or '')[:10],
+                            (fields.get('duedate') or '')[:10],
+                            mttr_days,
+                            overdue_days,
+                            issue.get('_source', 'unknown').upper()
+                        ))
+                    return rows
+
+                # MTTR 列內容各渲染一次，All 工作表直接接起 internal/vendor 的結果
+                mttr_resolved_headers = ['Issue Key', 'Assignee', 'Created', 'Resolved',
+                                         'Due Date', 'MTTR (Days)', 'Overdue (Days)', 'Source']
+                mttr_open_headers = ['Issue Key', 'Assignee', 'Created', 'Due Date',
+                                     'MTTR Ongoing (Days)', 'Overdue (Days)', 'Source']
+                mttr_resolved_rows_internal = build_mttr_resolved_rows(mttr_resolved_internal)
+                mttr_resolved_rows_vendor = build_mttr_resolved_rows(mttr_resolved_vendor)
+                mttr_open_rows_internal = build_mttr_open_rows(mttr_open_internal)
+                mttr_open_rows_vendor = build_mttr_open_rows(mttr_open_vendor)
 
                 # 建立 MTTR 工作表
-                create_sheet(wb, 'MTTR Resolved All', mttr_all_resolved, mttr_resolved_columns)
-                create_sheet(wb, 'MTTR Resolved Internal', mttr_resolved_internal, mttr_resolved_columns)
-                create_sheet(wb, 'MTTR Resolved Vendor', mttr_resolved_vendor, mttr_resolved_columns)
-                create_sheet(wb, 'MTTR Open All', mttr_all_open, mttr_open_columns)
-                create_sheet(wb, 'MTTR Open Internal', mttr_open_internal, mttr_open_columns)
-                create_sheet(wb, 'MTTR Open Vendor', mttr_open_vendor, mttr_open_columns)
+                create_sheet(wb, 'MTTR Resolved All', mttr_resolved_rows_internal + mttr_resolved_rows_vendor, mttr_resolved_headers)
+                create_sheet(wb, 'MTTR Resolved Internal', mttr_resolved_rows_internal, mttr_resolved_headers)
+                create_sheet(wb, 'MTTR Resolved Vendor', mttr_resolved_rows_vendor, mttr_resolved_headers)
+                create_sheet(wb, 'MTTR Open All', mttr_open_rows_internal + mttr_open_rows_vendor, mttr_open_headers)
+                create_sheet(wb, 'MTTR Open Internal', mttr_open_rows_internal, mttr_open_headers)
+                create_sheet(wb, 'MTTR Open Vendor', mttr_open_rows_vendor, mttr_open_headers)
 
                 # MTTR 摘要資料
                 mttr_summary_data = [
                     ['', ''],
                     ['===== MTTR 指標 =====', ''],
-                    ['MTTR Resolved Issues (Total)', len(mttr_all_resolved)],
+                    ['MTTR Resolved Issues (Total)', len(mttr_resolved_internal) + len(mttr_resolved_vendor)],
                     ['MTTR Resolved Issues (Internal)', len(mttr_resolved_internal)],
                     ['MTTR Resolved Issues (Vendor)', len(mttr_resolved_vendor)],
-                    ['MTTR Open Issues (Total)', len(mttr_all_open)],
+                    ['MTTR Open Issues (Total)', len(mttr_open_internal) + len(mttr_open_vendor)],
                     ['MTTR Open Issues (Internal)', len(mttr_open_internal)],
                     ['MTTR Open Issues (Vendor)', len(mttr_open_vendor)],
                 ]
 
         # 統計摘要
         ws_summary = wb.create_sheet(title='Summary', index=0)
+        ws_summary.column_dimensions['A'].width = 30
+        ws_summary.column_dimensions['B'].width = 20
+        # 來源統計各走一趟 Counter，不為計數配置四個丟棄用的中間列表
+        deg_by_src = Counter(i.get('_source', 'unknown') for i in filtered_degrade)
+        res_by_src = Counter(i.get('_source', 'unknown') for i in filtered_resolved)
         summary_data = [
             ['統計項目', '數量'],
             ['===== Degrade 分析 =====', ''],
             ['Degrade Issues (Total)', len(filtered_degrade)],
-            ['Degrade Issues (Internal)', len([i for i in filtered_degrade if i.get('_source') == 'internal'])],
-            ['Degrade Issues (Vendor)', len([i for i in filtered_degrade if i.get('_source') == 'vendor'])],
+            ['Degrade Issues (Internal)', deg_by_src['internal']],
+            ['Degrade Issues (Vendor)', deg_by_src['vendor']],
             ['Resolved Issues (Total)', len(filtered_resolved)],
-            ['Resolved Issues (Internal)', len([i for i in filtered_resolved if i.get('_source') == 'internal'])],
-            ['Resolved Issues (Vendor)', len([i for i in filtered_resolved if i.get('_source') == 'vendor'])],
-            ['Degrade %', f"{(len(filtered_degrade) / len(filtered_resolved) * 100) if len(filtered_resolved) > 0 else 0:.2f}%"],
+            ['Resolved Issues (Internal)', res_by_src['internal']],
+            ['Resolved Issues (Vendor)', res_by_src['vendor']],
+            ['Degrade %', f"{(len(filtered_degrade) / len(filtered_resolved) * 100) if filtered_resolved else 0:.2f}%"],
         ] + mttr_summary_data + [
             ['', ''],
             ['===== 說明 =====', ''],
@@ -1112,36 +1609,37 @@ def export_excel():
             ['Overdue', 'Resolved Date / Now - Due Date'],
         ]
         
-        for row_idx, (label, value) in enumerate(summary_data, 1):
-            cell_label = ws_summary.cell(row=row_idx, column=1, value=label)
-            cell_value = ws_summary.cell(row=row_idx, column=2, value=value)
-            if row_idx == 1:
-                cell_label.font = header_font
-                cell_label.fill = header_fill
-                cell_value.font = header_font
-                cell_value.fill = header_fill
-            cell_label.border = border
-            cell_value.border = border
-        
-        ws_summary.column_dimensions['A'].width = 30
-        ws_summary.column_dimensions['B'].width = 20
-        
-        # 儲存到記憶體
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
+        ws_summary.append(make_header_row(ws_summary, summary_data[0]))
+        for label, value in summary_data[1:]:
+            ws_summary.append([label, value])
+
+        # 寫到暫存檔再用 sendfile 分塊送出：xlsx 需要可 seek 的輸出，
+        # 檔案後盾讓尖峰記憶體不再隨匯出大小成長
+        tmp = tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False)
+        try:
+            wb.save(tmp.name)
+        finally:
+            tmp.close()
+
+        @after_this_request
+        def _cleanup_excel_tmp(response):
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            return response
+
         filename = f"jira_degrade_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        
+
         return send_file(
-            output,
+            tmp.name,
             mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             as_attachment=True,
             download_name=filename
         )
         
     except Exception as e:
-        print(f"❌ Excel 匯出失敗: {e}")
+        logger.error(f"❌ Excel 匯出失敗: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -1160,7 +1658,22 @@ def export_html():
         owner = request.args.get('owner')
         chart_limit = int(request.args.get('chart_limit', 20))  # 圖表顯示筆數
 
-        print(f"📤 匯出 HTML: chart_limit={chart_limit}, MTTR_ENABLED={MTTR_ENABLED}")
+        logger.debug(f"📤 匯出 HTML: chart_limit={chart_limit}, MTTR_ENABLED={MTTR_ENABLED}")
+
+        # 相同匯出條件 + 資料沒變：直接回快取好的 gzip 報告，整條渲染管線都省掉
+        accepts_gzip = 'gzip' in request.headers.get('Accept-Encoding', '')
+        report_key = (start_date, end_date, owner, chart_limit,
+                      data.get('_cache_ts', cache.timestamp), mttr_cache.timestamp)
+        if accepts_gzip:
+            with _REPORT_CACHE_LOCK:
+                cached = _REPORT_CACHE.get(report_key)
+            if cached is not None:
+                filename = f"jira_degrade_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+                return Response(cached, mimetype='text/html; charset=utf-8', headers={
+                    'Content-Disposition': f'attachment; filename={filename}',
+                    'Content-Encoding': 'gzip',
+                    'Vary': 'Accept-Encoding'
+                })
 
         # ===== MTTR 資料處理 =====
         mttr_html_section = ""
@@ -1170,59 +1683,48 @@ def export_html():
             mttr_data = get_mttr_data()
             if mttr_data:
                 # 過濾 MTTR 資料
-                mttr_resolved_internal = filter_issues(mttr_data['resolved']['internal'], start_date, end_date, owner, date_field='created')
-                mttr_resolved_vendor = filter_issues(mttr_data['resolved']['vendor'], start_date, end_date, owner, date_field='created')
-                mttr_open_internal = filter_issues(mttr_data['open']['internal'], start_date, end_date, owner, date_field='created')
-                mttr_open_vendor = filter_issues(mttr_data['open']['vendor'], start_date, end_date, owner, date_field='created')
+                mttr_resolved_internal, mttr_resolved_vendor, mttr_open_internal, mttr_open_vendor = \
+                    get_mttr_filtered(mttr_data, start_date, end_date, owner)
 
-                mttr_all_resolved = mttr_resolved_internal + mttr_resolved_vendor
-                mttr_all_open = mttr_open_internal + mttr_open_vendor
+                # All 視圖的統計直接串流兩個來源，不另外配置合併後的大列表
+                mttr_resolved_total = len(mttr_resolved_internal) + len(mttr_resolved_vendor)
+                mttr_open_total = len(mttr_open_internal) + len(mttr_open_vendor)
 
                 # 計算 MTTR 指標
-                mttr_resolved_stats_all = calculate_mttr_metrics(mttr_all_resolved, 'resolved')
+                mttr_resolved_stats_all = calculate_mttr_metrics(
+                    itertools.chain(mttr_resolved_internal, mttr_resolved_vendor), 'resolved')
                 mttr_resolved_stats_internal = calculate_mttr_metrics(mttr_resolved_internal, 'resolved')
                 mttr_resolved_stats_vendor = calculate_mttr_metrics(mttr_resolved_vendor, 'resolved')
 
-                mttr_open_stats_all = calculate_mttr_metrics(mttr_all_open, 'open')
+                mttr_open_stats_all = calculate_mttr_metrics(
+                    itertools.chain(mttr_open_internal, mttr_open_vendor), 'open')
                 mttr_open_stats_internal = calculate_mttr_metrics(mttr_open_internal, 'open')
                 mttr_open_stats_vendor = calculate_mttr_metrics(mttr_open_vendor, 'open')
 
                 # 準備圖表數據
-                mttr_resolved_all_labels = json.dumps([w['week'] for w in mttr_resolved_stats_all])
-                mttr_resolved_all_mttr = json.dumps([w['avg_mttr_days'] for w in mttr_resolved_stats_all])
-                mttr_resolved_all_overdue = json.dumps([w['avg_overdue_days'] for w in mttr_resolved_stats_all])
-                mttr_resolved_all_count = json.dumps([w['count'] for w in mttr_resolved_stats_all])
-
-                mttr_resolved_internal_labels = json.dumps([w['week'] for w in mttr_resolved_stats_internal])
-                mttr_resolved_internal_mttr = json.dumps([w['avg_mttr_days'] for w in mttr_resolved_stats_internal])
-                mttr_resolved_internal_overdue = json.dumps([w['avg_overdue_days'] for w in mttr_resolved_stats_internal])
-                mttr_resolved_internal_count = json.dumps([w['count'] for w in mttr_resolved_stats_internal])
-
-                mttr_resolved_vendor_labels = json.dumps([w['week'] for w in mttr_resolved_stats_vendor])
-                mttr_resolved_vendor_mttr = json.dumps([w['avg_mttr_days'] for w in mttr_resolved_stats_vendor])
-                mttr_resolved_vendor_overdue = json.dumps([w['avg_overdue_days'] for w in mttr_resolved_stats_vendor])
-                mttr_resolved_vendor_count = json.dumps([w['count'] for w in mttr_resolved_stats_vendor])
-
-                mttr_open_all_labels = json.dumps([w['week'] for w in mttr_open_stats_all])
-                mttr_open_all_mttr = json.dumps([w['avg_mttr_days'] for w in mttr_open_stats_all])
-                mttr_open_all_overdue = json.dumps([w['avg_overdue_days'] for w in mttr_open_stats_all])
-                mttr_open_all_count = json.dumps([w['count'] for w in mttr_open_stats_all])
-
-                mttr_open_internal_labels = json.dumps([w['week'] for w in mttr_open_stats_internal])
-                mttr_open_internal_mttr = json.dumps([w['avg_mttr_days'] for w in mttr_open_stats_internal])
-                mttr_open_internal_overdue = json.dumps([w['avg_overdue_days'] for w in mttr_open_stats_internal])
-                mttr_open_internal_count = json.dumps([w['count'] for w in mttr_open_stats_internal])
-
-                mttr_open_vendor_labels = json.dumps([w['week'] for w in mttr_open_stats_vendor])
-                mttr_open_vendor_mttr = json.dumps([w['avg_mttr_days'] for w in mttr_open_stats_vendor])
-                mttr_open_vendor_overdue = json.dumps([w['avg_overdue_days'] for w in mttr_open_stats_vendor])
-                mttr_open_vendor_count = json.dumps([w['count'] for w in mttr_open_stats_vendor])
+                mttr_resolved_all_labels, mttr_resolved_all_mttr, mttr_resolved_all_overdue, mttr_resolved_all_count = \
+                    _unpack_mttr_stats(mttr_resolved_stats_all)
+
+                mttr_resolved_internal_labels, mttr_resolved_internal_mttr, mttr_resolved_internal_overdue, mttr_resolved_internal_count = \
+                    _unpack_mttr_stats(mttr_resolved_stats_internal)
+
+                mttr_resolved_vendor_labels, mttr_resolved_vendor_mttr, mttr_resolved_vendor_overdue, mttr_resolved_vendor_count = \
+                    _unpack_mttr_stats(mttr_resolved_stats_vendor)
+
+                mttr_open_all_labels, mttr_open_all_mttr, mttr_open_all_overdue, mttr_open_all_count = \
+                    _unpack_mttr_stats(mttr_open_stats_all)
+
+                mttr_open_internal_labels, mttr_open_internal_mttr, mttr_open_internal_overdue, mttr_open_internal_count = \
+                    _unpack_mttr_stats(mttr_open_stats_internal)
+
+                mttr_open_vendor_labels, mttr_open_vendor_mttr, mttr_open_vendor_overdue, mttr_open_vendor_count = \
+                    _unpack_mttr_stats(mttr_open_stats_vendor)
 
                 # 週次日期範圍
-                mttr_resolved_internal_dates = json.dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in mttr_resolved_stats_internal})
-                mttr_resolved_vendor_dates = json.dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in mttr_resolved_stats_vendor})
-                mttr_open_internal_dates = json.dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in mttr_open_stats_internal})
-                mttr_open_vendor_dates = json.dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in mttr_open_stats_vendor})
+                mttr_resolved_internal_dates = _dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in mttr_resolved_stats_internal})
+                mttr_resolved_vendor_dates = _dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in mttr_resolved_stats_vendor})
+                mttr_open_internal_dates = _dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in mttr_open_stats_internal})
+                mttr_open_vendor_dates = _dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in mttr_open_stats_vendor})
 
                 # MTTR HTML 區塊
                 mttr_html_section = f"""
@@ -1234,7 +1736,7 @@ def export_html():
         <div class="stats-grid">
             <div class="stat-card">
                 <h3>Resolved Issues</h3>
-                <div class="value" style="color: #51cf66;">{len(mttr_all_resolved)}</div>
+                <div class="value" style="color: #51cf66;">{mttr_resolved_total}</div>
                 <div class="label">已解決問題數</div>
                 <div class="sub-stats">
                     <div class="sub-stat">
@@ -1249,7 +1751,7 @@ def export_html():
             </div>
             <div class="stat-card">
                 <h3>Open Issues</h3>
-                <div class="value" style="color: #ff6b6b;">{len(mttr_all_open)}</div>
+                <div class="value" style="color: #ff6b6b;">{mttr_open_total}</div>
                 <div class="label">未解決問題數</div>
                 <div class="sub-stats">
                     <div class="sub-stat">
@@ -1471,1397 +1973,269 @@ def export_html():
         console.log('✅ MTTR 圖表已載入');
 """
         
-        # 過濾資料 - degrade 使用 created，resolved 使用 created
-        filtered_degrade = filter_issues(data['degrade'], start_date, end_date, owner, date_field='created')
-        filtered_resolved = filter_issues(data['resolved'], start_date, end_date, owner, date_field='created')
-        
-        # 修復 _source 標記
-        for issue in filtered_degrade:
-            if issue.get('_source') not in ['internal', 'vendor']:
-                if 'vendorjira' in issue.get('self', '').lower():
-                    issue['_source'] = 'vendor'
-                else:
-                    issue['_source'] = 'internal'
-        
-        for issue in filtered_resolved:
-            if issue.get('_source') not in ['internal', 'vendor']:
-                if 'vendorjira' in issue.get('self', '').lower():
-                    issue['_source'] = 'vendor'
-                else:
-                    issue['_source'] = 'internal'
-        
-        # 分離內部和 Vendor
-        internal_degrade = [i for i in filtered_degrade if i.get('_source') == 'internal']
-        vendor_degrade = [i for i in filtered_degrade if i.get('_source') == 'vendor']
-        internal_resolved = [i for i in filtered_resolved if i.get('_source') == 'internal']
-        vendor_resolved = [i for i in filtered_resolved if i.get('_source') == 'vendor']
-        
-        manager = JiraDegradeManagerFast(
-            site=JIRA_CONFIG['internal']['site'],
-            user=JIRA_CONFIG['internal']['user'],
-            password=JIRA_CONFIG['internal']['password'],
-            token=JIRA_CONFIG['internal']['token']
-        )
-        
-        # 統計分析 - degrade 使用 created，resolved 使用 created
-        total_degrade = len(filtered_degrade)
-        total_resolved = len(filtered_resolved)
-        overall_percentage = (total_degrade / total_resolved * 100) if total_resolved > 0 else 0
-        
-        degrade_weekly = analyze_by_week_with_dates(filtered_degrade, date_field='created')
-        resolved_weekly = analyze_by_week_with_dates(filtered_resolved, date_field='created')
-        weekly_stats = calculate_weekly_percentage(degrade_weekly, resolved_weekly)
-        
-        degrade_weekly_internal = analyze_by_week_with_dates(internal_degrade, date_field='created')
-        degrade_weekly_vendor = analyze_by_week_with_dates(vendor_degrade, date_field='created')
-        resolved_weekly_internal = analyze_by_week_with_dates(internal_resolved, date_field='created')
-        resolved_weekly_vendor = analyze_by_week_with_dates(vendor_resolved, date_field='created')
-        
-        degrade_assignees_internal = manager.get_assignee_distribution(internal_degrade)
-        degrade_assignees_vendor = manager.get_assignee_distribution(vendor_degrade)
-        resolved_assignees_internal = manager.get_assignee_distribution(internal_resolved)
-        resolved_assignees_vendor = manager.get_assignee_distribution(vendor_resolved)
-        
-        # 週次趨勢數據（全部週次，不限制）
-        trend_labels = json.dumps([w['week'] for w in weekly_stats])
-        trend_data = json.dumps([w['percentage'] for w in weekly_stats])
-        
-        # 週次數量對比數據 - 新增 resolved_count
-        count_degrade = json.dumps([w['degrade_count'] for w in weekly_stats])
-        count_resolved = json.dumps([w['resolved_count'] for w in weekly_stats])
-        
+        # 過濾 + 統計直接重用 /api/stats 的 memoized 管線：
+        # 相同 (日期, owner, 快取時間戳) 的匯出不用重掃一次資料，
+        # 快取更新時 timestamp 改變、舊結果自然失效
+        stats = _compute_stats(data.get('_cache_ts', cache.timestamp), start_date, end_date, owner)
+
+        total_degrade = stats['overall']['degrade_count']
+        total_resolved = stats['overall']['resolved_count']
+        overall_percentage = stats['overall']['percentage']
+        internal_counts = stats['overall']['internal']
+        vendor_counts = stats['overall']['vendor']
+
+        weekly_stats = stats['weekly']
+
+        degrade_weekly_internal = stats['weekly_by_source']['internal']
+        degrade_weekly_vendor = stats['weekly_by_source']['vendor']
+        resolved_weekly_internal = stats['weekly_by_source_resolved']['internal']
+        resolved_weekly_vendor = stats['weekly_by_source_resolved']['vendor']
+
+        degrade_assignees_internal = stats['assignees']['degrade']['internal']
+        degrade_assignees_vendor = stats['assignees']['degrade']['vendor']
+        resolved_assignees_internal = stats['assignees']['resolved']['internal']
+        resolved_assignees_vendor = stats['assignees']['resolved']['vendor']
+        
+        # 圖表數據彙整成單一 payload：weekly_stats 只走一趟，
+        # 整包一次序列化（orjson 可用時快 3-5 倍），JS 端從 CHART_DATA 讀取
+        trend_labels = []
+        trend_data = []
+        count_degrade = []
+        count_resolved = []
+        for w in weekly_stats:
+            trend_labels.append(w['week'])
+            trend_data.append(w['percentage'])
+            count_degrade.append(w['degrade_count'])
+            count_resolved.append(w['resolved_count'])
+
         # 週次分布數據（內部/Vendor）- 全部週次
-        all_weeks_internal = sorted(set(list(degrade_weekly_internal.keys()) + list(resolved_weekly_internal.keys())))
-        all_weeks_vendor = sorted(set(list(degrade_weekly_vendor.keys()) + list(resolved_weekly_vendor.keys())))
-        
-        weekly_internal_labels = json.dumps(all_weeks_internal)
-        weekly_internal_degrade = json.dumps([degrade_weekly_internal.get(w, {}).get('count', 0) for w in all_weeks_internal])
-        weekly_internal_resolved = json.dumps([resolved_weekly_internal.get(w, {}).get('count', 0) for w in all_weeks_internal])
-        
-        weekly_vendor_labels = json.dumps(all_weeks_vendor)
-        weekly_vendor_degrade = json.dumps([degrade_weekly_vendor.get(w, {}).get('count', 0) for w in all_weeks_vendor])
-        weekly_vendor_resolved = json.dumps([resolved_weekly_vendor.get(w, {}).get('count', 0) for w in all_weeks_vendor])
-        
-        # 依據 chart_limit 限制 Assignee 數據
-        degrade_assignees_internal_top = dict(sorted(degrade_assignees_internal.items(), key=lambda x: x[1], reverse=True)[:chart_limit])
-        degrade_assignees_vendor_top = dict(sorted(degrade_assignees_vendor.items(), key=lambda x: x[1], reverse=True)[:chart_limit])
-        resolved_assignees_internal_top = dict(sorted(resolved_assignees_internal.items(), key=lambda x: x[1], reverse=True)[:chart_limit])
-        resolved_assignees_vendor_top = dict(sorted(resolved_assignees_vendor.items(), key=lambda x: x[1], reverse=True)[:chart_limit])
-        
-        degrade_int_labels = json.dumps(list(degrade_assignees_internal_top.keys()))
-        degrade_int_data = json.dumps(list(degrade_assignees_internal_top.values()))
-        degrade_vnd_labels = json.dumps(list(degrade_assignees_vendor_top.keys()))
-        degrade_vnd_data = json.dumps(list(degrade_assignees_vendor_top.values()))
-        resolved_int_labels = json.dumps(list(resolved_assignees_internal_top.keys()))
-        resolved_int_data = json.dumps(list(resolved_assignees_internal_top.values()))
-        resolved_vnd_labels = json.dumps(list(resolved_assignees_vendor_top.keys()))
-        resolved_vnd_data = json.dumps(list(resolved_assignees_vendor_top.values()))
+        all_weeks_internal = sorted(degrade_weekly_internal.keys() | resolved_weekly_internal.keys())
+        all_weeks_vendor = sorted(degrade_weekly_vendor.keys() | resolved_weekly_vendor.keys())
+
+        _empty = {}
+        chart_payload = {
+            'trend_labels': trend_labels,
+            'trend_data': trend_data,
+            'count_degrade': count_degrade,
+            'count_resolved': count_resolved,
+            'weekly_internal_labels': all_weeks_internal,
+            'weekly_internal_degrade': [degrade_weekly_internal.get(w, _empty).get('count', 0) for w in all_weeks_internal],
+            'weekly_internal_resolved': [resolved_weekly_internal.get(w, _empty).get('count', 0) for w in all_weeks_internal],
+            'weekly_vendor_labels': all_weeks_vendor,
+            'weekly_vendor_degrade': [degrade_weekly_vendor.get(w, _empty).get('count', 0) for w in all_weeks_vendor],
+            'weekly_vendor_resolved': [resolved_weekly_vendor.get(w, _empty).get('count', 0) for w in all_weeks_vendor],
+        }
+
+        # 依據 chart_limit 限制 Assignee 數據；top-N 與總數每個分布只算一次，
+        # 連同總數放進 payload，表格改由瀏覽器端從 CHART_DATA 渲染
+        for key, dist in (('degrade_int', degrade_assignees_internal),
+                          ('degrade_vnd', degrade_assignees_vendor),
+                          ('resolved_int', resolved_assignees_internal),
+                          ('resolved_vnd', resolved_assignees_vendor)):
+            # O(N log k) 選 top-k，不用整串排序
+            top = heapq.nlargest(chart_limit, dist.items(), key=itemgetter(1))
+            chart_payload[f'{key}_labels'] = [name for name, _ in top]
+            chart_payload[f'{key}_data'] = [cnt for _, cnt in top]
+            chart_payload[f'{key}_total'] = sum(dist.values())
+
+        chart_payload_json = _dumps(chart_payload)
         
         # 準備週次日期範圍數據（用於 JIRA 跳轉）
-        weekly_date_ranges_degrade_internal = {}
-        for week, stats in degrade_weekly_internal.items():
-            weekly_date_ranges_degrade_internal[week] = {
-                'start_date': stats.get('start_date'),
-                'end_date': stats.get('end_date'),
-                'start_datetime': stats.get('start_datetime'),
-                'end_datetime': stats.get('end_datetime')
-            }
-        
-        weekly_date_ranges_degrade_vendor = {}
-        for week, stats in degrade_weekly_vendor.items():
-            weekly_date_ranges_degrade_vendor[week] = {
-                'start_date': stats.get('start_date'),
-                'end_date': stats.get('end_date'),
-                'start_datetime': stats.get('start_datetime'),
-                'end_datetime': stats.get('end_datetime')
-            }
-        
-        weekly_date_ranges_resolved_internal = {}
-        for week, stats in resolved_weekly_internal.items():
-            weekly_date_ranges_resolved_internal[week] = {
-                'start_date': stats.get('start_date'),
-                'end_date': stats.get('end_date'),
-                'start_datetime': stats.get('start_datetime'),
-                'end_datetime': stats.get('end_datetime')
-            }
-        
-        weekly_date_ranges_resolved_vendor = {}
-        for week, stats in resolved_weekly_vendor.items():
-            weekly_date_ranges_resolved_vendor[week] = {
-                'start_date': stats.get('start_date'),
-                'end_date': stats.get('end_date'),
-                'start_datetime': stats.get('start_datetime'),
-                'end_datetime': stats.get('end_datetime')
-            }
-        
-        # 轉換為 JSON
-        date_ranges_degrade_internal_json = json.dumps(weekly_date_ranges_degrade_internal)
-        date_ranges_degrade_vendor_json = json.dumps(weekly_date_ranges_degrade_vendor)
-        date_ranges_resolved_internal_json = json.dumps(weekly_date_ranges_resolved_internal)
-        date_ranges_resolved_vendor_json = json.dumps(weekly_date_ranges_resolved_vendor)
+        # 週次統計的四個日期欄位由 _aggregate_issues 保證存在，
+        # itemgetter 一次取齊，dict comprehension 直接組出來轉 JSON
+        _range_keys = ('start_date', 'end_date', 'start_datetime', 'end_datetime')
+        _range_fields = itemgetter(*_range_keys)
+
+        def _week_date_ranges(weekly):
+            return {week: dict(zip(_range_keys, _range_fields(wstats)))
+                    for week, wstats in weekly.items()}
+
+        date_ranges_degrade_internal_json = _dumps(_week_date_ranges(degrade_weekly_internal))
+        date_ranges_degrade_vendor_json = _dumps(_week_date_ranges(degrade_weekly_vendor))
+        date_ranges_resolved_internal_json = _dumps(_week_date_ranges(resolved_weekly_internal))
+        date_ranges_resolved_vendor_json = _dumps(_week_date_ranges(resolved_weekly_vendor))
         
         # JIRA sites 和 filter IDs
-        jira_sites_json = json.dumps(data['jira_sites'])
-        filter_ids_json = json.dumps(FILTERS)
+
         
         # 當前過濾條件
-        current_filters_json = json.dumps({
+        current_filters_json = _dumps({
             'start_date': start_date or '',
             'end_date': end_date or '',
             'owner': owner or ''
         })
         
-        # 準備表格數據
-        def generate_assignee_table_html(assignee_dict, source, type_name, chart_limit):
-            """生成 Assignee 表格 HTML"""
-            sorted_data = sorted(assignee_dict.items(), key=lambda x: x[1], reverse=True)[:chart_limit]
-            total = sum(assignee_dict.values())
-            
-            site = data['jira_sites'][source]
-            filter_id = FILTERS[type_name][source]
-            
-            # 根據 type 使用不同的日期欄位
-            date_field = 'created' if type_name == 'degrade' else 'created'
-            
-            html = '<table style="width: 100%; border-collapse: collapse;">'
-            html += '<thead><tr style="background: #667eea; color: white;">'
-            html += '<th style="padding: 12px; text-align: left;">排名</th>'
-            html += '<th style="padding: 12px; text-align: left;">Assignee</th>'
-            html += '<th style="padding: 12px; text-align: left;">Count</th>'
-            html += '<th style="padding: 12px; text-align: left;">Percentage</th>'
-            html += '</tr></thead><tbody>'
-            
-            for index, (name, count) in enumerate(sorted_data, 1):
-                percentage = (count / total * 100) if total > 0 else 0
-                
-                # 建立 JIRA 連結 - 使用對應的日期欄位
-                jql = f'filter={filter_id} AND assignee="{name}"'
-                if start_date:
-                    jql += f' AND {date_field} >= "{start_date} 00:00"'
-                if end_date:
-                    jql += f' AND {date_field} <= "{end_date} 23:59"'
-                
-                url = f"https://{site}/issues/?jql={quote(jql)}"
-                
-                bg_color = '#f5f5f5' if index % 2 == 0 else 'white'
-                html += f'<tr style="background: {bg_color};">'
-                html += f'<td style="padding: 12px; border-bottom: 1px solid #eee;">{index}</td>'
-                html += f'<td style="padding: 12px; border-bottom: 1px solid #eee;"><a href="{url}" target="_blank" style="color: #667eea; text-decoration: none; font-weight: 500;">{name}</a></td>'
-                html += f'<td style="padding: 12px; border-bottom: 1px solid #eee;">{count}</td>'
-                html += f'<td style="padding: 12px; border-bottom: 1px solid #eee;">{percentage:.2f}%</td>'
-                html += '</tr>'
-            
-            html += '</tbody></table>'
-            return html
-        
-        table_degrade_internal = generate_assignee_table_html(degrade_assignees_internal, 'internal', 'degrade', chart_limit)
-        table_degrade_vendor = generate_assignee_table_html(degrade_assignees_vendor, 'vendor', 'degrade', chart_limit)
-        table_resolved_internal = generate_assignee_table_html(resolved_assignees_internal, 'internal', 'resolved', chart_limit)
-        table_resolved_vendor = generate_assignee_table_html(resolved_assignees_vendor, 'vendor', 'resolved', chart_limit)
-        
-        # 生成 HTML
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="zh-TW">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>JIRA Degrade % 分析報告</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1600px;
-            margin: 0 auto;
-        }}
-        
-        .header {{
-            background: white;
-            padding: 30px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-            margin-bottom: 30px;
-        }}
-        
-        .header h1 {{
-            color: #333;
-            font-size: 2.2em;
-            margin-bottom: 10px;
-        }}
-        
-        .header p {{
-            color: #666;
-            font-size: 1em;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        
-        .stat-card {{
-            background: white;
-            padding: 25px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-            text-align: center;
-            transition: transform 0.3s;
-        }}
-        
-        .stat-card:hover {{
-            transform: translateY(-5px);
-        }}
-        
-        .stat-card h3 {{
-            color: #666;
-            font-size: 1em;
-            margin-bottom: 10px;
-            text-transform: uppercase;
-        }}
-        
-        .stat-card .value {{
-            font-size: 3em;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        
-        .stat-card .sub-stats {{
-            display: flex;
-            justify-content: space-around;
-            margin-top: 15px;
-            padding-top: 15px;
-            border-top: 1px solid #eee;
-        }}
-        
-        .stat-card .sub-stat .label {{
-            font-size: 0.8em;
-            color: #999;
-        }}
-        
-        .stat-card .sub-stat .value {{
-            font-size: 1.2em;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        
-        .chart-container {{
-            background: white;
-            padding: 30px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-            margin-bottom: 30px;
-        }}
-        
-        .chart-container h2 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.5em;
-        }}
-        
-        .chart-wrapper {{
-            position: relative;
-            height: 400px;
-            cursor: pointer;
-        }}
-        
-        .chart-wrapper-dynamic {{
-            position: relative;
-            min-height: 400px;
-            cursor: pointer;
-        }}
-        
-        .badge {{
-            display: inline-block;
-            padding: 3px 10px;
-            border-radius: 12px;
-            font-size: 0.7em;
-            margin-left: 10px;
-        }}
-        
-        .badge-internal {{
-            background: #e3f2fd;
-            color: #1976d2;
-        }}
-        
-        .badge-vendor {{
-            background: #fff3e0;
-            color: #f57c00;
-        }}
-        
-        .info-banner {{
-            background: #e3f2fd;
-            color: #1976d2;
-            padding: 15px 20px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-            text-align: center;
-            font-size: 0.95em;
-        }}
-        
-        .info-banner strong {{
-            font-weight: 600;
-        }}
         
-        .table-container {{
-            background: white;
-            padding: 30px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-            margin-bottom: 30px;
-        }}
+        # 頁籤按鈕（避免在 f-string 運算式內使用反斜線，Python 3.12 以下不支援）
+        mttr_tab_button = '<button class="tab-button" onclick="switchTab(\'mttr\')">📈 MTTR 指標</button>' if MTTR_ENABLED else ''
+
+        # 生成 HTML：模板已抽成 templates/export_report.html，
+        # Jinja 編譯一次後由 Flask 快取；用 stream_template 分塊產出，
+        # 不在記憶體組整份報告、瀏覽器也能立刻開始下載
+        ctx = dict(
+            title_suffix=' + MTTR 指標' if MTTR_ENABLED else '',
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            chart_limit=chart_limit,
+            total_degrade=total_degrade,
+            total_resolved=total_resolved,
+            overall_percentage=f"{overall_percentage:.2f}",
+            internal_degrade_count=internal_counts['degrade_count'],
+            internal_resolved_count=internal_counts['resolved_count'],
+            vendor_degrade_count=vendor_counts['degrade_count'],
+            vendor_resolved_count=vendor_counts['resolved_count'],
+            chart_payload_json=chart_payload_json,
+            jira_sites_json=JIRA_SITES_JSON,
+            filter_ids_json=FILTERS_JSON,
+            current_filters_json=current_filters_json,
+            date_ranges_degrade_internal_json=date_ranges_degrade_internal_json,
+            date_ranges_degrade_vendor_json=date_ranges_degrade_vendor_json,
+            date_ranges_resolved_internal_json=date_ranges_resolved_internal_json,
+            date_ranges_resolved_vendor_json=date_ranges_resolved_vendor_json,
+            mttr_tab_button=mttr_tab_button,
+            mttr_html_section=mttr_html_section,
+            mttr_js_section=mttr_js_section
+        )
+
+        filename = f"jira_degrade_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+
+        headers = {'Content-Disposition': f'attachment; filename={filename}'}
+        stream = stream_with_context(stream_template('export_report.html', **ctx))
+
+        # 客戶端支援 gzip 就邊渲染邊壓縮（報告幾乎都是重複的 CSS/JS，壓縮比很高），
+        # 並在產完後把成品放進報告快取
+        if accepts_gzip:
+            headers['Content-Encoding'] = 'gzip'
+            headers['Vary'] = 'Accept-Encoding'
+            stream = _collect_report(_gzip_stream(stream), report_key)
+
+        return Response(stream, mimetype='text/html; charset=utf-8', headers=headers)
         
-        .table-container h2 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.3em;
-        }}
+    except Exception as e:
+        logger.error(f"❌ HTML 匯出失敗: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-        /* 頁籤樣式 */
-        .tab-navigation {{
-            display: flex;
-            gap: 10px;
-            margin-bottom: 30px;
-        }}
+@app.route('/api/export/mttr/html')
+def export_mttr_html():
+    """匯出 MTTR HTML 報告"""
+    if not MTTR_ENABLED:
+        return jsonify({'success': False, 'error': 'MTTR 功能未啟用'}), 400
 
-        .tab-button {{
-            padding: 15px 30px;
-            border: 2px solid #999;
-            border-radius: 10px 10px 0 0;
-            background: linear-gradient(180deg, #ffffff 0%, #d0d0d0 100%);
-            color: #333;
-            font-size: 1.1em;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s;
-        }}
+    try:
+        data = get_mttr_data()
+        if not data:
+            return jsonify({'success': False, 'error': '無法載入 MTTR 資料'}), 500
 
-        .tab-button:hover {{
-            background: linear-gradient(180deg, #f0f0f0 0%, #c0c0c0 100%);
-        }}
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
+        owner = request.args.get('owner')
 
-        .tab-button.active {{
-            background: linear-gradient(180deg, #7b8ff5 0%, #667eea 100%);
-            color: white;
-            border-color: #667eea;
-        }}
+        # 過濾資料
+        resolved_internal, resolved_vendor, open_internal, open_vendor = \
+            get_mttr_filtered(data, start_date, end_date, owner)
 
-        .tab-content {{
-            display: none;
-        }}
+        resolved_total = len(resolved_internal) + len(resolved_vendor)
+        open_total = len(open_internal) + len(open_vendor)
 
-        .tab-content.active {{
-            display: block;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1 id="pageTitle">📊 JIRA Degrade % 分析報告</h1>
-            <p id="pageDesc">公版 SQA/QC Degrade 問題統計分析</p>
-            <p style="margin-top: 10px; font-size: 0.9em; color: #999;">
-                生成時間: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | 圖表顯示筆數: {chart_limit}
-            </p>
-            <p style="margin-top: 5px; font-size: 0.85em; color: #999;">
-                📅 Degrade 使用 created 日期 | Resolved 使用 created 日期
-            </p>
-        </div>
+        # 計算 MTTR 指標（All 視圖直接串接兩個來源，不另外配置合併列表）
+        resolved_stats_all = calculate_mttr_metrics(
+            itertools.chain(resolved_internal, resolved_vendor), 'resolved')
+        resolved_stats_internal = calculate_mttr_metrics(resolved_internal, 'resolved')
+        resolved_stats_vendor = calculate_mttr_metrics(resolved_vendor, 'resolved')
 
-        <!-- 頁籤導航 -->
-        <div class="tab-navigation">
-            <button class="tab-button active" onclick="switchTab('degrade')">📊 Degrade 分析</button>
-            {'<button class="tab-button" onclick="switchTab(\'mttr\')">📈 MTTR 指標</button>' if MTTR_ENABLED else ''}
-        </div>
+        open_stats_all = calculate_mttr_metrics(
+            itertools.chain(open_internal, open_vendor), 'open')
+        open_stats_internal = calculate_mttr_metrics(open_internal, 'open')
+        open_stats_vendor = calculate_mttr_metrics(open_vendor, 'open')
 
-        <!-- Degrade 頁籤內容 -->
-        <div id="degradeTab" class="tab-content active">
+        # 準備圖表數據
+        resolved_all_labels, resolved_all_mttr, resolved_all_overdue, resolved_all_count = \
+            _unpack_mttr_stats(resolved_stats_all)
 
-        <div class="info-banner">
-            <strong>💡 提示：</strong> 圖表可以點擊！點擊週次 bar 可跳轉到 JIRA 查看該週的 issues，點擊 Assignee bar 可查看該人員的所有 issues
-        </div>
+        resolved_internal_labels, resolved_internal_mttr, resolved_internal_overdue, resolved_internal_count = \
+            _unpack_mttr_stats(resolved_stats_internal)
 
-        <div class="stats-grid">
-            <div class="stat-card">
-                <h3>Degrade Issues</h3>
-                <div class="value" id="degradeCount">{total_degrade}</div>
-                <div class="label">問題總數</div>
-                <div class="sub-stats">
-                    <div class="sub-stat">
-                        <div class="label">內部</div>
-                        <div class="value" onclick="openFilterInJira('degrade', 'internal')" style="cursor: pointer;">{len(internal_degrade)}</div>
-                    </div>
-                    <div class="sub-stat">
-                        <div class="label">Vendor</div>
-                        <div class="value" onclick="openFilterInJira('degrade', 'vendor')" style="cursor: pointer;">{len(vendor_degrade)}</div>
-                    </div>
-                </div>
-            </div>
-            <div class="stat-card">
-                <h3>Resolved Issues</h3>
-                <div class="value" id="resolvedCount">{total_resolved}</div>
-                <div class="label">解題總數</div>
-                <div class="sub-stats">
-                    <div class="sub-stat">
-                        <div class="label">內部</div>
-                        <div class="value" onclick="openFilterInJira('resolved', 'internal')" style="cursor: pointer;">{len(internal_resolved)}</div>
-                    </div>
-                    <div class="sub-stat">
-                        <div class="label">Vendor</div>
-                        <div class="value" onclick="openFilterInJira('resolved', 'vendor')" style="cursor: pointer;">{len(vendor_resolved)}</div>
-                    </div>
-                </div>
-            </div>
-            <div class="stat-card">
-                <h3>Degrade %</h3>
-                <div class="value">{overall_percentage:.2f}%</div>
-                <div class="label">整體比例</div>
-            </div>
-        </div>
-        
-        <!-- 每週趨勢圖 -->
-        <div class="chart-container">
-            <h2>📈 每週 Degrade % 與 軸：Degrade & CCC issue 數量趨勢（內部 + Vendor 合併）</h2>
-            <p style="color: #666; font-size: 0.9em; margin-top: 5px;">
-                💡 左側 Y 軸：Degrade % | 右側 Y 軸：軸：Degrade & CCC issue 數量
-                <br>📅 Degrade 使用 created 日期 | Resolved 使用 created 日期
-            </p>                
-            <div class="chart-wrapper">
-                <canvas id="trendChart"></canvas>
-            </div>
-        </div>
-        
-        <div class="chart-container">
-            <h2>📊 每週 Degrade vs CCC issue 數量</h2>
-            <div class="chart-wrapper">
-                <canvas id="countChart"></canvas>
-            </div>
-        </div>
-        
-        <div class="chart-container">
-            <h2>📅 每週 Degrade 數量分布 <span class="badge badge-internal">內部 JIRA</span> <small style="color: #999;">（點擊可跳轉 JIRA）</small></h2>
-            <div class="chart-wrapper">
-                <canvas id="weeklyDegradeInternal"></canvas>
-            </div>
-        </div>
-        
-        <div class="chart-container">
-            <h2>📅 每週 Degrade 數量分布 <span class="badge badge-vendor">Vendor JIRA</span> <small style="color: #999;">（點擊可跳轉 JIRA）</small></h2>
-            <div class="chart-wrapper">
-                <canvas id="weeklyDegradeVendor"></canvas>
-            </div>
-        </div>
-        
-        <div class="chart-container">
-            <h2>👤 Degrade Issues Assignee 分布 <span class="badge badge-internal">內部 JIRA</span> <small style="color: #999;">（Top {chart_limit}，點擊可跳轉 JIRA）</small></h2>
-            <div class="chart-wrapper-dynamic" id="degradeAssigneeInternalWrapper">
-                <canvas id="degradeAssigneeInternal"></canvas>
-            </div>
-        </div>
-        
-        <div class="chart-container">
-            <h2>👤 Degrade Issues Assignee 分布 <span class="badge badge-vendor">Vendor JIRA</span> <small style="color: #999;">（Top {chart_limit}，點擊可跳轉 JIRA）</small></h2>
-            <div class="chart-wrapper-dynamic" id="degradeAssigneeVendorWrapper">
-                <canvas id="degradeAssigneeVendor"></canvas>
-            </div>
-        </div>
-        
-        <div class="chart-container">
-            <h2>👤 Resolved Issues Assignee 分布 <span class="badge badge-internal">內部 JIRA</span> <small style="color: #999;">（Top {chart_limit}，點擊可跳轉 JIRA）</small></h2>
-            <div class="chart-wrapper-dynamic" id="resolvedAssigneeInternalWrapper">
-                <canvas id="resolvedAssigneeInternal"></canvas>
-            </div>
-        </div>
-        
-        <div class="chart-container">
-            <h2>👤 Resolved Issues Assignee 分布 <span class="badge badge-vendor">Vendor JIRA</span> <small style="color: #999;">（Top {chart_limit}，點擊可跳轉 JIRA）</small></h2>
-            <div class="chart-wrapper-dynamic" id="resolvedAssigneeVendorWrapper">
-                <canvas id="resolvedAssigneeVendor"></canvas>
-            </div>
-        </div>
-        
-        <div class="table-container">
-            <h2>📊 Degrade Issues Assignee 詳細分布 <span class="badge badge-internal">內部 JIRA</span> <small style="color: #999;">（Top {chart_limit}）</small></h2>
-            {table_degrade_internal}
-        </div>
-        
-        <div class="table-container">
-            <h2>📊 Degrade Issues Assignee 詳細分布 <span class="badge badge-vendor">Vendor JIRA</span> <small style="color: #999;">（Top {chart_limit}）</small></h2>
-            {table_degrade_vendor}
-        </div>
-        
-        <div class="table-container">
-            <h2>📊 Resolved Issues Assignee 詳細分布 <span class="badge badge-internal">內部 JIRA</span> <small style="color: #999;">（Top {chart_limit}）</small></h2>
-            {table_resolved_internal}
-        </div>
-        
-        <div class="table-container">
-            <h2>📊 Resolved Issues Assignee 詳細分布 <span class="badge badge-vendor">Vendor JIRA</span> <small style="color: #999;">（Top {chart_limit}）</small></h2>
-            {table_resolved_vendor}
-        </div>
+        resolved_vendor_labels, resolved_vendor_mttr, resolved_vendor_overdue, resolved_vendor_count = \
+            _unpack_mttr_stats(resolved_stats_vendor)
 
-        </div><!-- 結束 Degrade 頁籤 -->
-
-        <!-- MTTR 頁籤內容 -->
-        <div id="mttrTab" class="tab-content">
-        {mttr_html_section}
-        </div><!-- 結束 MTTR 頁籤 -->
-
-        <footer style="background: white; padding: 20px; border-radius: 15px; box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2); margin-top: 30px; text-align: center; color: #666;">
-            <p style="margin: 0; font-weight: 500;">© 2025 Copyright by Vince. All rights reserved.</p>
-            <p style="margin-top: 8px; font-size: 0.85em; color: #999;">CCC Degrade % 分析報告{' + MTTR 指標' if MTTR_ENABLED else ''}</p>
-        </footer>
-    </div>
-
-    <script>
-        const jiraSites = {jira_sites_json};
-        const filterIds = {filter_ids_json};
-        const currentFilters = {current_filters_json};
-
-        const weeklyDateRanges = {{
-            degrade_internal: {date_ranges_degrade_internal_json},
-            degrade_vendor: {date_ranges_degrade_vendor_json},
-            resolved_internal: {date_ranges_resolved_internal_json},
-            resolved_vendor: {date_ranges_resolved_vendor_json}
-        }};
+        open_all_labels, open_all_mttr, open_all_overdue, open_all_count = \
+            _unpack_mttr_stats(open_stats_all)
 
-        // 頁籤切換函數
-        function switchTab(tabName) {{
-            // 隱藏所有頁籤內容
-            document.querySelectorAll('.tab-content').forEach(content => {{
-                content.classList.remove('active');
-            }});
+        open_internal_labels, open_internal_mttr, open_internal_overdue, open_internal_count = \
+            _unpack_mttr_stats(open_stats_internal)
 
-            // 移除所有頁籤按鈕的 active 狀態
-            document.querySelectorAll('.tab-button').forEach(button => {{
-                button.classList.remove('active');
-            }});
+        open_vendor_labels, open_vendor_mttr, open_vendor_overdue, open_vendor_count = \
+            _unpack_mttr_stats(open_stats_vendor)
 
-            // 顯示選中的頁籤內容
-            const tabContent = document.getElementById(tabName + 'Tab');
-            if (tabContent) {{
-                tabContent.classList.add('active');
-            }}
+        # 準備週次日期範圍（用於 JIRA 連結）
+        resolved_internal_dates = _dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in resolved_stats_internal})
+        resolved_vendor_dates = _dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in resolved_stats_vendor})
+        open_internal_dates = _dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in open_stats_internal})
+        open_vendor_dates = _dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in open_stats_vendor})
 
-            // 設置選中的頁籤按鈕為 active
-            event.target.classList.add('active');
-
-            // 更新標題
-            const pageTitle = document.getElementById('pageTitle');
-            const pageDesc = document.getElementById('pageDesc');
-
-            if (tabName === 'degrade') {{
-                pageTitle.innerHTML = '📊 JIRA Degrade % 分析報告';
-                pageDesc.textContent = '公版 SQA/QC Degrade 問題統計分析';
-                document.title = 'JIRA Degrade % 分析報告';
-            }} else if (tabName === 'mttr') {{
-                pageTitle.innerHTML = '📈 MTTR 指標分析報告';
-                pageDesc.textContent = 'Mean Time To Resolve - 平均解決時間分析';
-                document.title = 'MTTR 指標分析報告';
-            }}
-        }}
+        filter_info = f"篩選條件: {start_date or '不限'} ~ {end_date or '不限'}" + (f", Assignee: {owner}" if owner else "")
 
-        function openFilterInJira(type, source) {{
-            const site = source === 'internal' ? jiraSites.internal : jiraSites.vendor;
-            const filterId = filterIds[type][source];
-            
-            let dateField = type === 'degrade' ? 'created' : 'created';
-            let jql = `filter=${{filterId}}`;
-            
-            if (currentFilters.start_date) {{
-                jql += ` AND ${{dateField}} >= "${{currentFilters.start_date}} 00:00"`;
-            }}
-            if (currentFilters.end_date) {{
-                jql += ` AND ${{dateField}} <= "${{currentFilters.end_date}} 23:59"`;
-            }}
-            if (currentFilters.owner) {{
-                jql += ` AND assignee="${{currentFilters.owner}}"`;
-            }}
-            
-            console.log(`🔗 跳轉 JIRA: ${{type}} (${{source}})`);
-            console.log(`   JQL: ${{jql}}`);
-            
-            const url = `https://${{site}}/issues/?jql=${{encodeURIComponent(jql)}}`;
-            window.open(url, '_blank');
-        }}
-
-        function openWeekInJira(week, source, type) {{
-            const site = source === 'internal' ? jiraSites.internal : jiraSites.vendor;
-            const filterId = filterIds[type][source];
-            
-            const dateRangesKey = `${{type}}_${{source}}`;
-            const dateRanges = weeklyDateRanges[dateRangesKey];
-            
-            if (!dateRanges || !dateRanges[week]) {{
-                alert(`無法找到週次 ${{week}} 的日期範圍`);
-                return;
-            }}
-            
-            const weekStartDate = dateRanges[week].start_date;
-            const weekEndDate = dateRanges[week].end_date;
-            
-            // 根據 type 使用不同的日期欄位
-            const dateField = type === 'degrade' ? 'created' : 'created';
-            let jql = `filter=${{filterId}} AND ${{dateField}} >= "${{weekStartDate}} 00:00" AND ${{dateField}} <= "${{weekEndDate}} 23:59"`;
-            
-            if (currentFilters.owner) {{
-                jql += ` AND assignee="${{currentFilters.owner}}"`;
-            }}
-            
-            console.log(`🔗 跳轉 JIRA: 週次 ${{week}} (${{source}}, ${{type}})`);
-            console.log(`   JQL: ${{jql}}`);
-            
-            const url = `https://${{site}}/issues/?jql=${{encodeURIComponent(jql)}}`;
-            window.open(url, '_blank');
-        }}
-        
-        function openAssigneeInJira(assigneeName, source, type) {{
-            const site = source === 'internal' ? jiraSites.internal : jiraSites.vendor;
-            const filterId = filterIds[type][source];
-            
-            // 根據 type 使用不同的日期欄位
-            const dateField = type === 'degrade' ? 'created' : 'created';
-            let jql = `filter=${{filterId}} AND assignee="${{assigneeName}}"`;
-            
-            if (currentFilters.start_date) {{
-                jql += ` AND ${{dateField}} >= "${{currentFilters.start_date}} 00:00"`;
-            }}
-            if (currentFilters.end_date) {{
-                jql += ` AND ${{dateField}} <= "${{currentFilters.end_date}} 23:59"`;
-            }}
-            
-            console.log(`🔗 跳轉 JIRA: Assignee ${{assigneeName}} (${{source}}, ${{type}})`);
-            console.log(`   JQL: ${{jql}}`);
-            
-            const url = `https://${{site}}/issues/?jql=${{encodeURIComponent(jql)}}`;
-            window.open(url, '_blank');
-        }}
-        
-        // 趨勢圖 - 三條線（Degrade 數量 + CCC issue 數量 + Degrade % 參考線）
-        new Chart(document.getElementById('trendChart'), {{
-            type: 'line',
-            data: {{
-                labels: {trend_labels},
-                datasets: [
-                    {{
-                        label: 'Degrade 數量',
-                        data: {count_degrade},
-                        borderColor: '#ff6b6b',
-                        backgroundColor: 'rgba(255, 107, 107, 0.1)',
-                        borderWidth: 3,
-                        fill: true,
-                        tension: 0.4,
-                        pointRadius: 5,
-                        pointHoverRadius: 7,
-                        yAxisID: 'y1'
-                    }},
-                    {{
-                        label: 'CCC issue 數量',
-                        data: {count_resolved},
-                        borderColor: '#51cf66',
-                        backgroundColor: 'rgba(81, 207, 102, 0.1)',
-                        borderWidth: 3,
-                        fill: false,
-                        tension: 0.4,
-                        pointRadius: 5,
-                        pointHoverRadius: 7,
-                        yAxisID: 'y1'
-                    }},
-                    {{
-                        label: 'Degrade % (參考)',
-                        data: {trend_data},
-                        borderColor: '#667eea',
-                        backgroundColor: 'transparent',
-                        borderWidth: 2,
-                        borderDash: [5, 5],
-                        fill: false,
-                        tension: 0.4,
-                        pointRadius: 3,
-                        pointHoverRadius: 5,
-                        yAxisID: 'y2',
-                        hidden: false
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                interaction: {{
-                    mode: 'index',
-                    intersect: false
-                }},
-                plugins: {{
-                    legend: {{ 
-                        display: true,
-                        position: 'top',
-                        labels: {{
-                            usePointStyle: true,
-                            padding: 15
-                        }}
-                    }},
-                    tooltip: {{
-                        callbacks: {{
-                            label: function(context) {{
-                                let label = context.dataset.label || '';
-                                if (label) {{
-                                    label += ': ';
-                                }}
-                                if (context.parsed.y !== null) {{
-                                    if (context.datasetIndex === 2) {{
-                                        label += context.parsed.y.toFixed(2) + '%';
-                                    }} else {{
-                                        label += context.parsed.y + ' issues';
-                                    }}
-                                }}
-                                return label;
-                            }}
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        type: 'linear',
-                        display: false,
-                        position: 'left',
-                        beginAtZero: true,
-                        title: {{ 
-                            display: true, 
-                            text: 'Degrade 數量',
-                            color: '#ff6b6b',
-                            font: {{
-                                size: 14,
-                                weight: 'bold'
-                            }}
-                        }},
-                        ticks: {{
-                            color: '#ff6b6b'
-                        }}
-                    }},
-                    y1: {{
-                        type: 'linear',
-                        display: true,
-                        position: 'right',
-                        beginAtZero: true,
-                        title: {{ 
-                            display: true, 
-                            text: 'CCC issue 數量',
-                            color: '#51cf66',
-                            font: {{
-                                size: 14,
-                                weight: 'bold'
-                            }}
-                        }},
-                        ticks: {{
-                            color: '#51cf66'
-                        }},
-                        grid: {{
-                            drawOnChartArea: false
-                        }}
-                    }},
-                    y2: {{
-                        type: 'linear',
-                        display: true,
-                        position: 'left',
-                        beginAtZero: true,
-                        title: {{ 
-                            display: true, 
-                            text: 'Degrade %',
-                            color: '#667eea',
-                            font: {{
-                                size: 14,
-                                weight: 'bold'
-                            }}
-                        }},
-                        ticks: {{
-                            color: '#667eea'
-                        }},
-                        max: 100,
-                        grid: {{
-                            drawOnChartArea: false
-                        }}
-                    }}
-                }}
-            }}
-        }});
-        
-        // 數量圖
-        new Chart(document.getElementById('countChart'), {{
-            type: 'bar',
-            data: {{
-                labels: {trend_labels},
-                datasets: [
-                    {{
-                        label: 'Degrade Issues',
-                        data: {count_degrade},
-                        backgroundColor: '#ff6b6b'
-                    }},
-                    {{
-                        label: 'Resolved Issues',
-                        data: {count_resolved},
-                        backgroundColor: '#51cf66'
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: true }}
-                }}
-            }}
-        }});
-        
-        // 週次 Degrade 分布 - 內部（可點擊）
-        new Chart(document.getElementById('weeklyDegradeInternal'), {{
-            type: 'bar',
-            data: {{
-                labels: {weekly_internal_labels},
-                datasets: [
-                    {{
-                        label: 'Degrade Issues',
-                        data: {weekly_internal_degrade},
-                        backgroundColor: '#ff6b6b'
-                    }},
-                    {{
-                        label: 'Resolved Issues',
-                        data: {weekly_internal_resolved},
-                        backgroundColor: '#51cf66'
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                onClick: (event, elements) => {{
-                    if (elements.length > 0) {{
-                        const index = elements[0].index;
-                        const datasetIndex = elements[0].datasetIndex;
-                        const weeks = {weekly_internal_labels};
-                        const week = weeks[index];
-                        const type = datasetIndex === 0 ? 'degrade' : 'resolved';
-                        openWeekInJira(week, 'internal', type);
-                    }}
-                }},
-                plugins: {{
-                    legend: {{ display: true }},
-                    tooltip: {{
-                        callbacks: {{
-                            afterBody: () => ['', '💡 點擊可跳轉到 JIRA 查看該週的 issues']
-                        }}
-                    }}
-                }}
-            }}
-        }});
-        
-        // 週次 Degrade 分布 - Vendor（可點擊）
-        new Chart(document.getElementById('weeklyDegradeVendor'), {{
-            type: 'bar',
-            data: {{
-                labels: {weekly_vendor_labels},
-                datasets: [
-                    {{
-                        label: 'Degrade Issues',
-                        data: {weekly_vendor_degrade},
-                        backgroundColor: '#ff6b6b'
-                    }},
-                    {{
-                        label: 'Resolved Issues',
-                        data: {weekly_vendor_resolved},
-                        backgroundColor: '#51cf66'
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                onClick: (event, elements) => {{
-                    if (elements.length > 0) {{
-                        const index = elements[0].index;
-                        const datasetIndex = elements[0].datasetIndex;
-                        const weeks = {weekly_vendor_labels};
-                        const week = weeks[index];
-                        const type = datasetIndex === 0 ? 'degrade' : 'resolved';
-                        openWeekInJira(week, 'vendor', type);
-                    }}
-                }},
-                plugins: {{
-                    legend: {{ display: true }},
-                    tooltip: {{
-                        callbacks: {{
-                            afterBody: () => ['', '💡 點擊可跳轉到 JIRA 查看該週的 issues']
-                        }}
-                    }}
-                }}
-            }}
-        }});
-        
-        // 動態高度 Assignee 圖表函數
-        function drawAssigneeChart(canvasId, labels, data, chartLabel, color, source, type) {{
-            const ctx = document.getElementById(canvasId).getContext('2d');
-            const chartHeight = Math.max(400, labels.length * 30);
-            const wrapper = document.getElementById(canvasId + 'Wrapper');
-            if (wrapper) {{
-                wrapper.style.height = chartHeight + 'px';
-            }}
-            
-            new Chart(ctx, {{
-                type: 'bar',
-                data: {{
-                    labels: labels,
-                    datasets: [{{
-                        label: chartLabel,
-                        data: data,
-                        backgroundColor: color
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    indexAxis: 'y',
-                    onClick: (event, elements) => {{
-                        if (elements.length > 0) {{
-                            const index = elements[0].index;
-                            const assigneeName = labels[index];
-                            openAssigneeInJira(assigneeName, source, type);
-                        }}
-                    }},
-                    plugins: {{
-                        legend: {{ display: true }},
-                        tooltip: {{
-                            callbacks: {{
-                                afterBody: () => ['', '💡 點擊可跳轉到 JIRA 查看該 Assignee 的 issues']
-                            }}
-                        }}
-                    }}
-                }}
-            }});
-        }}
-        
-        // Assignee 圖表
-        drawAssigneeChart('degradeAssigneeInternal', {degrade_int_labels}, {degrade_int_data}, 'Degrade Issues', '#ff6b6b', 'internal', 'degrade');
-        drawAssigneeChart('degradeAssigneeVendor', {degrade_vnd_labels}, {degrade_vnd_data}, 'Degrade Issues', '#ff6b6b', 'vendor', 'degrade');
-        drawAssigneeChart('resolvedAssigneeInternal', {resolved_int_labels}, {resolved_int_data}, 'Resolved Issues', '#51cf66', 'internal', 'resolved');
-        drawAssigneeChart('resolvedAssigneeVendor', {resolved_vnd_labels}, {resolved_vnd_data}, 'Resolved Issues', '#51cf66', 'vendor', 'resolved');
-
-        console.log('✅ Degrade 圖表已載入');
-
-        {mttr_js_section}
-    </script>
-</body>
-</html>
-"""
-        
-        output = io.BytesIO(html_content.encode('utf-8'))
-        output.seek(0)
-        
-        filename = f"jira_degrade_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        
-        return send_file(
-            output,
-            mimetype='text/html',
-            as_attachment=True,
-            download_name=filename
-        )
-        
-    except Exception as e:
-        print(f"❌ HTML 匯出失敗: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': str(e)}), 500
-
-@app.route('/api/export/mttr/html')
-def export_mttr_html():
-    """匯出 MTTR HTML 報告"""
-    if not MTTR_ENABLED:
-        return jsonify({'success': False, 'error': 'MTTR 功能未啟用'}), 400
-
-    try:
-        data = get_mttr_data()
-        if not data:
-            return jsonify({'success': False, 'error': '無法載入 MTTR 資料'}), 500
-
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        owner = request.args.get('owner')
-
-        # 過濾資料
-        resolved_internal = filter_issues(data['resolved']['internal'], start_date, end_date, owner, date_field='created')
-        resolved_vendor = filter_issues(data['resolved']['vendor'], start_date, end_date, owner, date_field='created')
-        open_internal = filter_issues(data['open']['internal'], start_date, end_date, owner, date_field='created')
-        open_vendor = filter_issues(data['open']['vendor'], start_date, end_date, owner, date_field='created')
-
-        all_resolved = resolved_internal + resolved_vendor
-        all_open = open_internal + open_vendor
-
-        # 計算 MTTR 指標
-        resolved_stats_all = calculate_mttr_metrics(all_resolved, 'resolved')
-        resolved_stats_internal = calculate_mttr_metrics(resolved_internal, 'resolved')
-        resolved_stats_vendor = calculate_mttr_metrics(resolved_vendor, 'resolved')
-
-        open_stats_all = calculate_mttr_metrics(all_open, 'open')
-        open_stats_internal = calculate_mttr_metrics(open_internal, 'open')
-        open_stats_vendor = calculate_mttr_metrics(open_vendor, 'open')
-
-        # 準備圖表數據
-        resolved_all_labels = json.dumps([w['week'] for w in resolved_stats_all])
-        resolved_all_mttr = json.dumps([w['avg_mttr_days'] for w in resolved_stats_all])
-        resolved_all_overdue = json.dumps([w['avg_overdue_days'] for w in resolved_stats_all])
-        resolved_all_count = json.dumps([w['count'] for w in resolved_stats_all])
-
-        resolved_internal_labels = json.dumps([w['week'] for w in resolved_stats_internal])
-        resolved_internal_mttr = json.dumps([w['avg_mttr_days'] for w in resolved_stats_internal])
-        resolved_internal_overdue = json.dumps([w['avg_overdue_days'] for w in resolved_stats_internal])
-        resolved_internal_count = json.dumps([w['count'] for w in resolved_stats_internal])
-
-        resolved_vendor_labels = json.dumps([w['week'] for w in resolved_stats_vendor])
-        resolved_vendor_mttr = json.dumps([w['avg_mttr_days'] for w in resolved_stats_vendor])
-        resolved_vendor_overdue = json.dumps([w['avg_overdue_days'] for w in resolved_stats_vendor])
-        resolved_vendor_count = json.dumps([w['count'] for w in resolved_stats_vendor])
-
-        open_all_labels = json.dumps([w['week'] for w in open_stats_all])
-        open_all_mttr = json.dumps([w['avg_mttr_days'] for w in open_stats_all])
-        open_all_overdue = json.dumps([w['avg_overdue_days'] for w in open_stats_all])
-        open_all_count = json.dumps([w['count'] for w in open_stats_all])
-
-        open_internal_labels = json.dumps([w['week'] for w in open_stats_internal])
-        open_internal_mttr = json.dumps([w['avg_mttr_days'] for w in open_stats_internal])
-        open_internal_overdue = json.dumps([w['avg_overdue_days'] for w in open_stats_internal])
-        open_internal_count = json.dumps([w['count'] for w in open_stats_internal])
-
-        open_vendor_labels = json.dumps([w['week'] for w in open_stats_vendor])
-        open_vendor_mttr = json.dumps([w['avg_mttr_days'] for w in open_stats_vendor])
-        open_vendor_overdue = json.dumps([w['avg_overdue_days'] for w in open_stats_vendor])
-        open_vendor_count = json.dumps([w['count'] for w in open_stats_vendor])
-
-        # 準備週次日期範圍（用於 JIRA 連結）
-        resolved_internal_dates = json.dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in resolved_stats_internal})
-        resolved_vendor_dates = json.dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in resolved_stats_vendor})
-        open_internal_dates = json.dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in open_stats_internal})
-        open_vendor_dates = json.dumps({w['week']: {'start_date': w['start_date'], 'end_date': w['end_date']} for w in open_stats_vendor})
-
-        filter_info = f"篩選條件: {start_date or '不限'} ~ {end_date or '不限'}" + (f", Assignee: {owner}" if owner else "")
-
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="zh-TW">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>MTTR 指標分析報告</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        .container {{ max-width: 1600px; margin: 0 auto; }}
-        .header {{
-            background: white;
-            padding: 30px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-            margin-bottom: 30px;
-        }}
-        .header h1 {{ color: #333; font-size: 2.2em; margin-bottom: 10px; }}
-        .header p {{ color: #666; font-size: 1em; }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .stat-card {{
-            background: white;
-            padding: 25px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-            text-align: center;
-        }}
-        .stat-card h3 {{ color: #333; margin-bottom: 10px; }}
-        .stat-card .value {{ font-size: 2.5em; font-weight: bold; color: #667eea; }}
-        .stat-card .label {{ color: #666; font-size: 0.9em; }}
-        .chart-container {{
-            background: white;
-            padding: 25px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-            margin-bottom: 30px;
-        }}
-        .chart-container h2 {{ color: #333; margin-bottom: 20px; font-size: 1.3em; }}
-        .chart-wrapper {{ height: 400px; position: relative; }}
-        .badge {{
-            display: inline-block;
-            padding: 3px 10px;
-            border-radius: 12px;
-            font-size: 0.75em;
-            font-weight: 500;
-        }}
-        .badge-internal {{ background: #e3f2fd; color: #1976d2; }}
-        .badge-vendor {{ background: #fce4ec; color: #c2185b; }}
-        .info-box {{
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-        }}
-        .info-box p {{ margin: 5px 0; }}
-        .info-box ul {{ margin: 10px 0 10px 20px; }}
-        footer {{
-            background: white;
-            padding: 20px;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-            margin-top: 30px;
-            text-align: center;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📈 MTTR 指標分析報告</h1>
-            <p>匯出時間: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p>{filter_info}</p>
-        </div>
-
-        <div class="stats-grid">
-            <div class="stat-card">
-                <h3>Resolved Issues</h3>
-                <div class="value">{len(all_resolved)}</div>
-                <div class="label">已解決問題數（內部: {len(resolved_internal)} / Vendor: {len(resolved_vendor)}）</div>
-            </div>
-            <div class="stat-card">
-                <h3>Open Issues</h3>
-                <div class="value">{len(all_open)}</div>
-                <div class="label">未解決問題數（內部: {len(open_internal)} / Vendor: {len(open_vendor)}）</div>
-            </div>
-        </div>
-
-        <div class="chart-container">
-            <h2>📋 MTTR 指標說明</h2>
-            <div class="info-box">
-                <p><strong>已解決問題 (Resolved):</strong></p>
-                <ul>
-                    <li><strong>MTTR 指標:</strong> Resolved Date - Created Date (平均解決天數)</li>
-                    <li><strong>平均 Overdue 天數:</strong> Resolved Date - Due Date (僅計算有 Due Date 且超期的問題)</li>
-                </ul>
-                <p><strong>未解決問題 (Open/Ongoing):</strong></p>
-                <ul>
-                    <li><strong>MTTR(ongoing) 指標:</strong> Now - Created Date (目前等待天數)</li>
-                    <li><strong>平均 Overdue 天數:</strong> Now - Due Date (僅計算有 Due Date 且超期的問題)</li>
-                </ul>
-            </div>
-        </div>
-
-        <div class="chart-container">
-            <h2>📈 MTTR 趨勢 - 已解決問題（內部 + Vendor）</h2>
-            <div class="chart-wrapper"><canvas id="resolvedAllChart"></canvas></div>
-        </div>
-
-        <div class="chart-container">
-            <h2>📈 MTTR 趨勢 - 已解決問題 <span class="badge badge-internal">內部 JIRA</span></h2>
-            <div class="chart-wrapper"><canvas id="resolvedInternalChart"></canvas></div>
-        </div>
-
-        <div class="chart-container">
-            <h2>📈 MTTR 趨勢 - 已解決問題 <span class="badge badge-vendor">Vendor JIRA</span></h2>
-            <div class="chart-wrapper"><canvas id="resolvedVendorChart"></canvas></div>
-        </div>
-
-        <div class="chart-container">
-            <h2>📈 MTTR(ongoing) 趨勢 - 未解決問題（內部 + Vendor）</h2>
-            <div class="chart-wrapper"><canvas id="openAllChart"></canvas></div>
-        </div>
-
-        <div class="chart-container">
-            <h2>📈 MTTR(ongoing) 趨勢 - 未解決問題 <span class="badge badge-internal">內部 JIRA</span></h2>
-            <div class="chart-wrapper"><canvas id="openInternalChart"></canvas></div>
-        </div>
-
-        <div class="chart-container">
-            <h2>📈 MTTR(ongoing) 趨勢 - 未解決問題 <span class="badge badge-vendor">Vendor JIRA</span></h2>
-            <div class="chart-wrapper"><canvas id="openVendorChart"></canvas></div>
-        </div>
-
-        <footer>
-            <p>© 2025 Copyright by Vince. All rights reserved.</p>
-            <p>MTTR 指標分析報告</p>
-        </footer>
-    </div>
-
-    <script>
-        const jiraSites = {{
-            internal: '{data["jira_sites"]["internal"]}',
-            vendor: '{data["jira_sites"]["vendor"]}'
-        }};
-
-        const mttrFilterIds = {{
-            resolved: {{
-                internal: '{MTTR_FILTERS["resolved"]["internal"] or ""}',
-                vendor: '{MTTR_FILTERS["resolved"]["vendor"] or ""}'
-            }},
-            open: {{
-                internal: '{MTTR_FILTERS["open"]["internal"] or ""}',
-                vendor: '{MTTR_FILTERS["open"]["vendor"] or ""}'
-            }}
-        }};
-
-        const weekDates = {{
-            resolved_internal: {resolved_internal_dates},
-            resolved_vendor: {resolved_vendor_dates},
-            open_internal: {open_internal_dates},
-            open_vendor: {open_vendor_dates}
-        }};
-
-        function openMttrWeekInJira(week, source, type) {{
-            const site = jiraSites[source];
-            const filterId = mttrFilterIds[type][source];
-            if (!filterId) return;
-
-            const dateKey = type + '_' + source;
-            const weekData = weekDates[dateKey][week];
-            if (!weekData) return;
-
-            let jql = `filter=${{filterId}} AND created >= "${{weekData.start_date}} 00:00" AND created <= "${{weekData.end_date}} 23:59"`;
-            const url = `https://${{site}}/issues/?jql=${{encodeURIComponent(jql)}}`;
-            window.open(url, '_blank');
-        }}
-
-        function drawMttrChart(canvasId, labels, mttrData, overdueData, countData, source, type) {{
-            const ctx = document.getElementById(canvasId).getContext('2d');
-            const clickable = source !== null && type !== null;
-
-            new Chart(ctx, {{
-                type: 'line',
-                data: {{
-                    labels: labels,
-                    datasets: [
-                        {{
-                            label: type === 'resolved' ? '平均 MTTR 天數' : '平均 MTTR(ongoing) 天數',
-                            data: mttrData,
-                            borderColor: '#667eea',
-                            backgroundColor: 'rgba(102, 126, 234, 0.1)',
-                            borderWidth: 3,
-                            fill: true,
-                            tension: 0.4,
-                            yAxisID: 'y'
-                        }},
-                        {{
-                            label: '平均 Overdue 天數',
-                            data: overdueData,
-                            borderColor: '#ff6b6b',
-                            borderWidth: 3,
-                            fill: false,
-                            tension: 0.4,
-                            yAxisID: 'y'
-                        }},
-                        {{
-                            label: 'Issue 數量',
-                            data: countData,
-                            borderColor: '#51cf66',
-                            borderWidth: 2,
-                            borderDash: [5, 5],
-                            fill: false,
-                            tension: 0.4,
-                            yAxisID: 'y1'
-                        }}
-                    ]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    interaction: {{ mode: 'index', intersect: false }},
-                    onClick: clickable ? (event, elements) => {{
-                        if (elements.length > 0) {{
-                            const index = elements[0].index;
-                            const week = labels[index];
-                            openMttrWeekInJira(week, source, type);
-                        }}
-                    }} : undefined,
-                    plugins: {{
-                        legend: {{ display: true, position: 'top' }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
-                                    let label = context.dataset.label || '';
-                                    if (label) label += ': ';
-                                    if (context.parsed.y !== null) {{
-                                        label += context.datasetIndex === 2 ? context.parsed.y + ' issues' : context.parsed.y.toFixed(2) + ' 天';
-                                    }}
-                                    return label;
-                                }},
-                                footer: clickable ? () => ['點擊查看 JIRA Issues'] : undefined
-                            }}
-                        }}
-                    }},
-                    scales: {{
-                        y: {{
-                            type: 'linear',
-                            display: true,
-                            position: 'left',
-                            beginAtZero: true,
-                            title: {{ display: true, text: '天數', color: '#667eea' }},
-                            ticks: {{ color: '#667eea' }}
-                        }},
-                        y1: {{
-                            type: 'linear',
-                            display: true,
-                            position: 'right',
-                            beginAtZero: true,
-                            title: {{ display: true, text: 'Issue 數量', color: '#51cf66' }},
-                            ticks: {{ color: '#51cf66' }},
-                            grid: {{ drawOnChartArea: false }}
-                        }}
-                    }}
-                }}
-            }});
-        }}
-
-        // 繪製所有圖表
-        drawMttrChart('resolvedAllChart', {resolved_all_labels}, {resolved_all_mttr}, {resolved_all_overdue}, {resolved_all_count}, null, null);
-        drawMttrChart('resolvedInternalChart', {resolved_internal_labels}, {resolved_internal_mttr}, {resolved_internal_overdue}, {resolved_internal_count}, 'internal', 'resolved');
-        drawMttrChart('resolvedVendorChart', {resolved_vendor_labels}, {resolved_vendor_mttr}, {resolved_vendor_overdue}, {resolved_vendor_count}, 'vendor', 'resolved');
-        drawMttrChart('openAllChart', {open_all_labels}, {open_all_mttr}, {open_all_overdue}, {open_all_count}, null, null);
-        drawMttrChart('openInternalChart', {open_internal_labels}, {open_internal_mttr}, {open_internal_overdue}, {open_internal_count}, 'internal', 'open');
-        drawMttrChart('openVendorChart', {open_vendor_labels}, {open_vendor_mttr}, {open_vendor_overdue}, {open_vendor_count}, 'vendor', 'open');
-
-        console.log('✅ MTTR 圖表已載入');
-    </script>
-</body>
-</html>
-"""
-
-        output = io.BytesIO(html_content.encode('utf-8'))
-        output.seek(0)
+        # 模板編譯一次後由 Jinja 快取；串流輸出避免先在記憶體組出整份 HTML
+        ctx = {
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'filter_info': filter_info,
+            'resolved_total': resolved_total,
+            'resolved_internal_count': len(resolved_internal),
+            'resolved_vendor_count': len(resolved_vendor),
+            'open_total': open_total,
+            'open_internal_count': len(open_internal),
+            'open_vendor_count': len(open_vendor),
+            'jira_site_internal': data['jira_sites']['internal'],
+            'jira_site_vendor': data['jira_sites']['vendor'],
+            'filter_resolved_internal': MTTR_FILTERS['resolved']['internal'] or '',
+            'filter_resolved_vendor': MTTR_FILTERS['resolved']['vendor'] or '',
+            'filter_open_internal': MTTR_FILTERS['open']['internal'] or '',
+            'filter_open_vendor': MTTR_FILTERS['open']['vendor'] or '',
+            'resolved_internal_dates': resolved_internal_dates,
+            'resolved_vendor_dates': resolved_vendor_dates,
+            'open_internal_dates': open_internal_dates,
+            'open_vendor_dates': open_vendor_dates,
+            'resolved_all_labels': resolved_all_labels,
+            'resolved_all_mttr': resolved_all_mttr,
+            'resolved_all_overdue': resolved_all_overdue,
+            'resolved_all_count': resolved_all_count,
+            'resolved_internal_labels': resolved_internal_labels,
+            'resolved_internal_mttr': resolved_internal_mttr,
+            'resolved_internal_overdue': resolved_internal_overdue,
+            'resolved_internal_count_series': resolved_internal_count,
+            'resolved_vendor_labels': resolved_vendor_labels,
+            'resolved_vendor_mttr': resolved_vendor_mttr,
+            'resolved_vendor_overdue': resolved_vendor_overdue,
+            'resolved_vendor_count_series': resolved_vendor_count,
+            'open_all_labels': open_all_labels,
+            'open_all_mttr': open_all_mttr,
+            'open_all_overdue': open_all_overdue,
+            'open_all_count': open_all_count,
+            'open_internal_labels': open_internal_labels,
+            'open_internal_mttr': open_internal_mttr,
+            'open_internal_overdue': open_internal_overdue,
+            'open_internal_count_series': open_internal_count,
+            'open_vendor_labels': open_vendor_labels,
+            'open_vendor_mttr': open_vendor_mttr,
+            'open_vendor_overdue': open_vendor_overdue,
+            'open_vendor_count_series': open_vendor_count,
+        }
 
         filename = f"mttr_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+        headers = {'Content-Disposition': f'attachment; filename={filename}'}
+        stream = stream_with_context(stream_template('export_mttr_report.html', **ctx))
 
-        return send_file(
-            output,
-            mimetype='text/html',
-            as_attachment=True,
-            download_name=filename
-        )
+        # 客戶端支援 gzip 就邊渲染邊壓縮（level 1 CPU 便宜、壓縮率夠用）
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            headers['Content-Encoding'] = 'gzip'
+            headers['Vary'] = 'Accept-Encoding'
+            stream = _gzip_stream(stream)
+
+        return Response(stream, mimetype='text/html; charset=utf-8', headers=headers)
 
     except Exception as e:
-        print(f"❌ MTTR HTML 匯出失敗: {e}")
+        logger.error(f"❌ MTTR HTML 匯出失敗: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -2882,9 +2256,11 @@ def get_local_ip():
 
 if __name__ == '__main__':
     # 從 .env 讀取設定，沒有才使用預設值
+    # 注意：這裡是開發用的 Werkzeug 伺服器（單執行緒）
+    # 正式環境請用 gunicorn 啟動（見 start.sh / README.md）
     host = os.getenv('FLASK_HOST', '0.0.0.0')
     port = int(os.getenv('FLASK_PORT', 5000))
-    debug = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
+    debug = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     local_ip = get_local_ip()
     
     print("=" * 70)
@@ -6,6 +6,7 @@ JIRA Degrade 分析管理模組 - 超快速版本
 - Resolved issues 使用 resolutiondate 欄位
 - 加入詳細的錯誤檢測和警告機制
 """
+import logging
 import os
 import requests
 import re
@@ -15,6 +16,20 @@ from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+# orjson 是 C 實作的 JSON 庫，解析大型 JIRA 回應快 2-3 倍；沒安裝時退回 requests 內建
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+def _loads_response(response: requests.Response) -> Dict[str, Any]:
+    """解析 JSON 回應（優先用 orjson，直接吃 bytes 省一次解碼）"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 class JiraDegradeManagerFast:
     """JIRA Degrade 統計管理類別 - 優化版本"""
     
@@ -51,13 +66,23 @@ class JiraDegradeManagerFast:
             return requests.post(url, **kwargs)
         else:
             raise ValueError(f"不支援的 HTTP 方法: {method}")
-        
+
+    def _search_page(self, filter_id: str, start_at: int, batch_size: int) -> requests.Response:
+        """抓取 filter 搜尋結果的單一分頁（狀態碼交由呼叫端判斷）"""
+        url = f"{self.base_url}/rest/api/2/search"
+        params = {
+            'jql': f'filter={filter_id}',
+            'startAt': start_at,
+            'maxResults': batch_size,
+            # 只要統計實際會讀的欄位：少抓的資料不只省網路，也會一直留在快取裡佔記憶體
+            'fields': 'key,assignee,created,resolutiondate,duedate'
+        }
+        return self._make_request(url, params=params, timeout=60)
+
     def get_filter_issues_fast(self, filter_id: str, max_results: int = None) -> Dict[str, Any]:
         """
         快速取得指定 filter 的所有 issues
         """
-        all_issues = []
-        start_at = 0
         batch_size = 500
         filter_owner = None  # 初始為 None
         
@@ -69,107 +94,111 @@ class JiraDegradeManagerFast:
                 filter_url = f"{self.base_url}/rest/api/2/filter/{filter_id}"
                 filter_response = self._make_request(filter_url, timeout=10)
                 if filter_response.status_code == 200:
-                    filter_data = filter_response.json()
+                    filter_data = _loads_response(filter_response)
                     owner_info = filter_data.get('owner', {})
                     filter_owner = owner_info.get('displayName') or owner_info.get('name')
                     if filter_owner:
-                        print(f"  📋 Filter {filter_id} owner: {filter_owner}")
+                        logger.debug(f"  📋 Filter {filter_id} owner: {filter_owner}")
             except Exception as e:
-                print(f"  ⚠️  無法取得 Filter {filter_id} 的 owner 資訊: {e}")
+                logger.warning(f"  ⚠️  無法取得 Filter {filter_id} 的 owner 資訊: {e}")
             
             # ✅ 如果無法取得 filter owner，使用連線帳號作為 fallback
             if not filter_owner:
                 filter_owner = self.user  # 使用連線的帳號
-                print(f"  📋 Filter {filter_id} 使用連線帳號: {filter_owner}")
+                logger.debug(f"  📋 Filter {filter_id} 使用連線帳號: {filter_owner}")
             
-            while True:
-                url = f"{self.base_url}/rest/api/2/search"
-                params = {
-                    'jql': f'filter={filter_id}',
-                    'startAt': start_at,
-                    'maxResults': batch_size,
-                    'fields': 'key,assignee,created,resolutiondate,updated,duedate'
+            # 先抓第一頁拿到 total；其餘分頁彼此獨立，直接以 startAt 平行抓取，
+            # 大 filter 的載入時間不再隨頁數線性累加
+            response = self._search_page(filter_id, 0, batch_size)
+
+            # 檢查認證失敗
+            if response.status_code == 401:
+                error_msg = f"認證失敗 - 請先登入 JIRA"
+                logger.error(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
+                return {
+                    'success': False,
+                    'issues': [],
+                    'error': error_msg,
+                    'error_type': 'AUTH_FAILED',
+                    'site': self.site,
+                    'filter_id': filter_id,
+                    'filter_owner': filter_owner or self.user  # ✅ 確保有值
+                }
+            
+            # 檢查權限不足
+            if response.status_code == 403:
+                error_msg = f"權限不足 - 無法存取 Filter {filter_id}"
+                logger.error(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
+                return {
+                    'success': False,
+                    'issues': [],
+                    'error': error_msg,
+                    'error_type': 'PERMISSION_DENIED',
+                    'site': self.site,
+                    'filter_id': filter_id,
+                    'filter_owner': filter_owner or self.user  # ✅ 確保有值
+                }
+            
+            # 檢查 filter 不存在
+            if response.status_code == 404:
+                error_msg = f"Filter 不存在 - Filter ID: {filter_id}"
+                logger.error(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
+                return {
+                    'success': False,
+                    'issues': [],
+                    'error': error_msg,
+                    'error_type': 'FILTER_NOT_FOUND',
+                    'site': self.site,
+                    'filter_id': filter_id,
+                    'filter_owner': filter_owner or self.user  # ✅ 確保有值
                 }
-                
-                response = self._make_request(url, params=params, timeout=60)
-                
-                # 檢查認證失敗
-                if response.status_code == 401:
-                    error_msg = f"認證失敗 - 請先登入 JIRA"
-                    print(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
-                    return {
-                        'success': False,
-                        'issues': [],
-                        'error': error_msg,
-                        'error_type': 'AUTH_FAILED',
-                        'site': self.site,
-                        'filter_id': filter_id,
-                        'filter_owner': filter_owner or self.user  # ✅ 確保有值
-                    }
-                
-                # 檢查權限不足
-                if response.status_code == 403:
-                    error_msg = f"權限不足 - 無法存取 Filter {filter_id}"
-                    print(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
-                    return {
-                        'success': False,
-                        'issues': [],
-                        'error': error_msg,
-                        'error_type': 'PERMISSION_DENIED',
-                        'site': self.site,
-                        'filter_id': filter_id,
-                        'filter_owner': filter_owner or self.user  # ✅ 確保有值
-                    }
-                
-                # 檢查 filter 不存在
-                if response.status_code == 404:
-                    error_msg = f"Filter 不存在 - Filter ID: {filter_id}"
-                    print(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
-                    return {
-                        'success': False,
-                        'issues': [],
-                        'error': error_msg,
-                        'error_type': 'FILTER_NOT_FOUND',
-                        'site': self.site,
-                        'filter_id': filter_id,
-                        'filter_owner': filter_owner or self.user  # ✅ 確保有值
-                    }
-                
-                # 其他 HTTP 錯誤（包含 HTTP 500）
-                if response.status_code != 200:
-                    error_msg = f"HTTP {response.status_code}"
-                    print(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
-                    return {
-                        'success': False,
-                        'issues': [],
-                        'error': error_msg,
-                        'error_type': 'HTTP_ERROR',
-                        'site': self.site,
-                        'filter_id': filter_id,
-                        'filter_owner': filter_owner or self.user  # ✅ 確保有值
-                    }
-                
-                data = response.json()
-                issues = data.get('issues', [])
-                
-                if not issues:
-                    break
-                
-                all_issues.extend(issues)
-                
-                total = data.get('total', 0)
-                print(f"  📊 Filter {filter_id}: 已載入 {len(all_issues)}/{total} 筆")
-                
-                if max_results and len(all_issues) >= max_results:
-                    break
-                
-                if start_at + batch_size >= total:
-                    break
-                
-                start_at += batch_size
+            
+            # 其他 HTTP 錯誤（包含 HTTP 500）
+            if response.status_code != 200:
+                error_msg = f"HTTP {response.status_code}"
+                logger.error(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
+                return {
+                    'success': False,
+                    'issues': [],
+                    'error': error_msg,
+                    'error_type': 'HTTP_ERROR',
+                    'site': self.site,
+                    'filter_id': filter_id,
+                    'filter_owner': filter_owner or self.user  # ✅ 確保有值
+                }
+
+            data = _loads_response(response)
+            all_issues = data.get('issues', [])
+            total = data.get('total', 0)
+            logger.debug(f"  📊 Filter {filter_id}: 已載入 {len(all_issues)}/{total} 筆")
+
+            page_starts = list(range(batch_size, total, batch_size))
+            if max_results:
+                page_starts = [s for s in page_starts if s < max_results]
+
+            if all_issues and page_starts:
+                with ThreadPoolExecutor(max_workers=min(4, len(page_starts))) as executor:
+                    # executor.map 依 startAt 順序回傳，結果天然維持原本的排序
+                    pages = executor.map(
+                        lambda s: self._search_page(filter_id, s, batch_size), page_starts)
+                    for page_response in pages:
+                        if page_response.status_code != 200:
+                            error_msg = f"HTTP {page_response.status_code}"
+                            logger.error(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
+                            return {
+                                'success': False,
+                                'issues': [],
+                                'error': error_msg,
+                                'error_type': 'HTTP_ERROR',
+                                'site': self.site,
+                                'filter_id': filter_id,
+                                'filter_owner': filter_owner or self.user  # ✅ 確保有值
+                            }
+                        all_issues.extend(_loads_response(page_response).get('issues', []))
+                        logger.debug(f"  📊 Filter {filter_id}: 已載入 {len(all_issues)}/{total} 筆")
             
             elapsed = time.time() - start_time
-            print(f"  ✓ Filter {filter_id} 完成: {len(all_issues)} 筆 ({elapsed:.1f}秒)")
+            logger.info(f"  ✓ Filter {filter_id} 完成: {len(all_issues)} 筆 ({elapsed:.1f}秒)")
             
             final_issues = all_issues[:max_results] if max_results else all_issues
             return {
@@ -182,7 +211,7 @@ class JiraDegradeManagerFast:
             
         except requests.exceptions.Timeout:
             error_msg = f"連線逾時 - 請檢查網路連線"
-            print(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
+            logger.error(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
             return {
                 'success': False,
                 'issues': [],
@@ -194,7 +223,7 @@ class JiraDegradeManagerFast:
             }
         except requests.exceptions.ConnectionError:
             error_msg = f"無法連線到 {self.site}"
-            print(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
+            logger.error(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
             return {
                 'success': False,
                 'issues': [],
@@ -206,7 +235,7 @@ class JiraDegradeManagerFast:
             }
         except Exception as e:
             error_msg = str(e)
-            print(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
+            logger.error(f"  ❌ Filter {filter_id} 失敗: {error_msg}")
             return {
                 'success': False,
                 'issues': [],
@@ -217,24 +246,28 @@ class JiraDegradeManagerFast:
                 'filter_owner': filter_owner or self.user  # ✅ 確保有值
             }
     
-    def get_week_number(self, date_str: str) -> str:
+    @staticmethod
+    def get_week_number(date_str: str) -> str:
         """
         將日期轉換為週次 (YYYY-Wxx)
         """
         try:
             if 'T' in date_str:
                 date_str = date_str.split('T')[0]
-            
-            date_obj = datetime.strptime(date_str[:10], '%Y-%m-%d')
+
+            # fromisoformat 是 C 實作，比 strptime 快一個數量級
+            date_obj = datetime.fromisoformat(date_str[:10])
             iso_calendar = date_obj.isocalendar()
             return f"{iso_calendar[0]}-W{iso_calendar[1]:02d}"
         except Exception as e:
             return "Unknown"
-    
-    def analyze_by_week(self, issues: List[Dict[str, Any]], date_field: str = 'updated') -> Dict[str, Any]:
+
+    @staticmethod
+    def analyze_by_week(issues: List[Dict[str, Any]], date_field: str = 'updated') -> Dict[str, Any]:
         """
         按週統計 issues - 優化版本
         支援不同的日期欄位：created, resolutiondate, updated
+        純統計函式，不需要 JIRA 連線，可直接透過類別呼叫
         """
         weekly_stats = defaultdict(lambda: {
             'count': 0,
@@ -249,7 +282,7 @@ class JiraDegradeManagerFast:
             if not date_str:
                 continue
             
-            week = self.get_week_number(date_str)
+            week = JiraDegradeManagerFast.get_week_number(date_str)
             weekly_stats[week]['count'] += 1
             weekly_stats[week]['issues'].append(issue.get('key'))
             
@@ -263,9 +296,11 @@ class JiraDegradeManagerFast:
         
         return dict(weekly_stats)
     
-    def get_assignee_distribution(self, issues: List[Dict[str, Any]]) -> Dict[str, int]:
+    @staticmethod
+    def get_assignee_distribution(issues: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         統計 assignee 分布 - 優化版本
+        純統計函式，不需要 JIRA 連線，可直接透過類別呼叫
         """
         assignee_stats = defaultdict(int)
         
@@ -283,21 +318,18 @@ class JiraDegradeManagerFast:
         return dict(assignee_stats)
 
 
-def load_all_filters_parallel(jira_configs, filters):
+def fetch_filters_parallel(jira_configs, filters, task_names=None):
     """
-    並行載入所有 filters - 這是速度提升的關鍵！
-    
+    並行抓取指定的 filters（預設全部四個）
+
     Args:
         jira_configs: JIRA 連線設定
         filters: Filter IDs
-        
+        task_names: 要抓取的任務名稱列表（如 ['internal_degrade']），None 表示全部
+
     Returns:
-        所有資料 + 警告信息
+        (results, warnings) - results 為 task_name -> issues 列表（已標記 _source）
     """
-    print("=" * 70)
-    print("🚀 開始並行載入 JIRA 資料...")
-    start_time = time.time()
-    
     # 建立 JIRA managers
     internal_jira = JiraDegradeManagerFast(
         site=jira_configs['internal']['site'],
@@ -305,14 +337,14 @@ def load_all_filters_parallel(jira_configs, filters):
         password=jira_configs['internal']['password'],
         token=jira_configs['internal']['token']
     )
-    
+
     vendor_jira = JiraDegradeManagerFast(
         site=jira_configs['vendor']['site'],
         user=jira_configs['vendor']['user'],
         password=jira_configs['vendor']['password'],
         token=jira_configs['vendor']['token']
     )
-    
+
     # 定義要執行的任務
     tasks = [
         ('internal_degrade', internal_jira, filters['degrade']['internal'], 'internal', 'degrade'),
@@ -320,11 +352,16 @@ def load_all_filters_parallel(jira_configs, filters):
         ('internal_resolved', internal_jira, filters['resolved']['internal'], 'internal', 'resolved'),
         ('vendor_resolved', vendor_jira, filters['resolved']['vendor'], 'vendor', 'resolved')
     ]
-    
+
+    # 只抓取指定的任務（過期的 filters），其他沿用快取
+    if task_names is not None:
+        wanted = set(task_names)
+        tasks = [t for t in tasks if t[0] in wanted]
+
     # 使用 ThreadPoolExecutor 並行執行
     results = {}
     warnings = []  # 收集警告信息
-    
+
     with ThreadPoolExecutor(max_workers=4) as executor:
         # 提交所有任務
         future_to_task = {
@@ -353,10 +390,10 @@ def load_all_filters_parallel(jira_configs, filters):
                         'error_type': result.get('error_type', 'UNKNOWN_ERROR')
                     }
                     warnings.append(warning)
-                    print(f"  ⚠️  {task_name} 載入失敗，已加入警告")
+                    logger.warning(f"  ⚠️  {task_name} 載入失敗，已加入警告")
                     
             except Exception as e:
-                print(f"  ❌ {task_name} 失敗: {e}")
+                logger.error(f"  ❌ {task_name} 失敗: {e}")
                 results[task_name] = []
                 warnings.append({
                     'source': source,
@@ -365,40 +402,54 @@ def load_all_filters_parallel(jira_configs, filters):
                     'error_type': 'UNKNOWN_ERROR'
                 })
     
-    # 標記來源並合併
-    for issue in results.get('internal_degrade', []):
-        issue['_source'] = 'internal'
-    for issue in results.get('vendor_degrade', []):
-        issue['_source'] = 'vendor'
-    for issue in results.get('internal_resolved', []):
-        issue['_source'] = 'internal'
-    for issue in results.get('vendor_resolved', []):
-        issue['_source'] = 'vendor'
-    
+    # 標記來源
+    for task_name, _, _, source, _ in tasks:
+        for issue in results.get(task_name, []):
+            issue['_source'] = source
+
+    return results, warnings
+
+
+def load_all_filters_parallel(jira_configs, filters):
+    """
+    並行載入所有 filters - 這是速度提升的關鍵！
+
+    Args:
+        jira_configs: JIRA 連線設定
+        filters: Filter IDs
+
+    Returns:
+        所有資料 + 警告信息
+    """
+    logger.info("=" * 70)
+    logger.info("🚀 開始並行載入 JIRA 資料...")
+    start_time = time.time()
+
+    results, warnings = fetch_filters_parallel(jira_configs, filters)
+
     all_degrade = results.get('internal_degrade', []) + results.get('vendor_degrade', [])
     all_resolved = results.get('internal_resolved', []) + results.get('vendor_resolved', [])
-    
-    print("\n📊 統計分析中...")
-    # 使用任一 manager 做統計
+
+    logger.info("\n📊 統計分析中...")
     # Degrade 使用 created，Resolved 使用 resolutiondate
-    degrade_weekly = internal_jira.analyze_by_week(all_degrade, date_field='created')
-    resolved_weekly = internal_jira.analyze_by_week(all_resolved, date_field='resolutiondate')
-    degrade_assignees = internal_jira.get_assignee_distribution(all_degrade)
-    resolved_assignees = internal_jira.get_assignee_distribution(all_resolved)
-    
+    degrade_weekly = JiraDegradeManagerFast.analyze_by_week(all_degrade, date_field='created')
+    resolved_weekly = JiraDegradeManagerFast.analyze_by_week(all_resolved, date_field='resolutiondate')
+    degrade_assignees = JiraDegradeManagerFast.get_assignee_distribution(all_degrade)
+    resolved_assignees = JiraDegradeManagerFast.get_assignee_distribution(all_resolved)
+
     total_time = time.time() - start_time
-    print(f"\n✅ 資料載入完成！")
-    print(f"  ⏱  總耗時: {total_time:.1f} 秒")
-    print(f"  📈 Degrade: {len(all_degrade)} 筆 (使用 created 日期)")
-    print(f"  📈 Resolved: {len(all_resolved)} 筆 (使用 resolutiondate)")
+    logger.info(f"\n✅ 資料載入完成！")
+    logger.info(f"  ⏱  總耗時: {total_time:.1f} 秒")
+    logger.info(f"  📈 Degrade: {len(all_degrade)} 筆 (使用 created 日期)")
+    logger.info(f"  📈 Resolved: {len(all_resolved)} 筆 (使用 resolutiondate)")
     
     if warnings:
-        print(f"  ⚠️  警告: {len(warnings)} 個來源載入失敗")
+        logger.warning(f"  ⚠️  警告: {len(warnings)} 個來源載入失敗")
         for w in warnings:
-            print(f"     - {w['source']} {w['type']}: {w['error']}")
+            logger.info(f"     - {w['source']} {w['type']}: {w['error']}")
     
-    print(f"  🚀 平均每秒處理: {(len(all_degrade) + len(all_resolved)) / total_time:.0f} 筆" if total_time > 0 else "  🚀 即時完成")
-    print("=" * 70)
+    logger.info(f"  🚀 平均每秒處理: {(len(all_degrade) + len(all_resolved)) / total_time:.0f} 筆" if total_time > 0 else "  🚀 即時完成")
+    logger.info("=" * 70)
     
     return {
         'degrade': {
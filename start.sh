@@ -212,4 +212,14 @@ echo "============================================================"
 echo ""
 
 # 執行 Flask 應用
-exec $PYTHON_CMD app.py
\ No newline at end of file
+# FLASK_ENV=production 時改用 gunicorn（多 worker 並行服務，--preload 共用快取記憶體）
+if [ "$FLASK_ENV" = "production" ] && command -v gunicorn &> /dev/null; then
+    GUNICORN_WORKERS="${GUNICORN_WORKERS:-4}"
+    GUNICORN_THREADS="${GUNICORN_THREADS:-8}"
+    FLASK_PORT="${FLASK_PORT:-5000}"
+    echo -e "${GREEN}✓${NC} 以 gunicorn 啟動 (workers=$GUNICORN_WORKERS, threads=$GUNICORN_THREADS)"
+    exec gunicorn -w "$GUNICORN_WORKERS" --threads "$GUNICORN_THREADS" --preload \
+        -b "0.0.0.0:$FLASK_PORT" app:app
+else
+    exec $PYTHON_CMD app.py
+fi
\ No newline at end of file